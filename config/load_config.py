@@ -2,7 +2,7 @@ import os
 import yaml
 
 from loguru import logger
-from models import Account, Config
+from models import Account, Config, format_proxy
 
 
 def get_accounts():
@@ -33,6 +33,15 @@ def get_accounts():
             )
 
 
+def get_spare_proxies() -> list[str]:
+    proxies_path = os.path.join(os.path.dirname(__file__), "proxies.txt")
+    if not os.path.exists(proxies_path):
+        return []
+
+    with open(proxies_path, "r") as f:
+        return [format_proxy(line.strip()) for line in f if line.strip()]
+
+
 def load_config() -> Config:
     settings_path = os.path.join(os.path.dirname(__file__), "settings.yaml")
     if not os.path.exists(settings_path):
@@ -42,10 +51,6 @@ def load_config() -> Config:
     with open(settings_path, "r") as f:
         settings = yaml.safe_load(f)
 
-    if not settings.get("eth_rpc"):
-        logger.error(f"eth_rpc is not provided in settings.yaml")
-        exit(1)
-
     if not settings.get("threads"):
         logger.error(f"threads is not provided in settings.yaml")
         exit(1)
@@ -54,10 +59,48 @@ def load_config() -> Config:
         logger.error(f"delay_between_quests is not provided in settings.yaml")
         exit(1)
 
+    min_threads = settings.get("min_threads") or settings["threads"]
+    max_threads = settings.get("max_threads") or settings["threads"]
+    if not min_threads <= settings["threads"] <= max_threads:
+        logger.error(f"threads must be between min_threads and max_threads in settings.yaml")
+        exit(1)
+
     accounts = list(get_accounts())
     return Config(
-        eth_rpc=settings["eth_rpc"],
+        eth_rpc=settings.get("eth_rpc") or None,
         threads=settings["threads"],
+        min_threads=min_threads,
+        max_threads=max_threads,
+        active_accounts=settings.get("active_accounts") or settings["threads"] * 10,
+        max_per_proxy=settings.get("max_per_proxy", 0),
+        max_per_host=settings.get("max_per_host", 0),
+        api_rps=settings.get("api_rps", 0),
+        api_burst=settings.get("api_burst") or max(int(settings.get("api_rps", 0)), 1),
+        quests_cache_ttl=settings.get("quests_cache_ttl", 600),
         delay_between_quests=settings["delay_between_quests"],
+        quests_concurrency=settings.get("quests_concurrency", 3),
+        quests_spacing=settings.get("quests_spacing", settings["delay_between_quests"]),
+        retry_attempts=settings.get("retry_attempts", 5),
+        retry_base_delay=settings.get("retry_base_delay", 1),
+        retry_max_delay=settings.get("retry_max_delay", 30),
+        retry_budget_per_account=settings.get("retry_budget_per_account", 20),
+        retry_budget_ratio=settings.get("retry_budget_ratio", 0.2),
+        proxy_breaker_threshold=settings.get("proxy_breaker_threshold", 5),
+        host_breaker_threshold=settings.get("host_breaker_threshold", 20),
+        breaker_recovery_time=settings.get("breaker_recovery_time", 60),
+        proxy_check=settings.get("proxy_check", True),
+        proxy_check_timeout=settings.get("proxy_check_timeout", 10),
+        proxy_check_threads=settings.get("proxy_check_threads", 50),
+        proxy_rotation_threshold=settings.get("proxy_rotation_threshold", 3),
+        prescan=settings.get("prescan", False),
+        prescan_threads=settings.get("prescan_threads", 100),
+        twitter_threads=settings.get("twitter_threads", 0),
+        request_timeout=settings.get("request_timeout", 30),
+        max_idle_sessions=settings.get("max_idle_sessions") or max_threads,
+        auth_timeout=settings.get("auth_timeout", 300),
+        bind_timeout=settings.get("bind_timeout", 600),
+        quests_timeout=settings.get("quests_timeout", 1800),
+        account_timeout=settings.get("account_timeout", 3600),
         accounts=accounts,
+        spare_proxies=get_spare_proxies(),
     )
@@ -1,8 +1,44 @@
-import asyncio
+from concurrent.futures import ThreadPoolExecutor
 
 from config.load_config import load_config
 from models import Config
+from src.scheduler import SlotScheduler, AdaptiveConcurrency
+from src.storage import ProgressJournal, ProxyStats, TokenStore, TwitterBinds, WalletAddresses
+from src.limits import RequestLimits, TokenBucket
+from src.cache import SingleFlightCache
+from src.retry import RetryPolicy, RetryBudget
+from src.breaker import CircuitBreakers
+from src.proxy_pool import ProxyPool
+from src.session_pool import SessionPool
 
 
 config: Config = load_config()
-semaphore = asyncio.Semaphore(config.threads)
+scheduler = SlotScheduler(config.threads)
+concurrency = AdaptiveConcurrency(scheduler, config.min_threads, config.max_threads)
+journal = ProgressJournal()
+tokens = TokenStore()
+twitter_binds = TwitterBinds()
+wallet_addresses = WalletAddresses()
+limits = RequestLimits(config.max_per_proxy, config.max_per_host)
+api_rate_limiter = TokenBucket(config.api_rps, config.api_burst)
+quests_cache = SingleFlightCache(config.quests_cache_ttl)
+retry_policy = RetryPolicy(
+    config.retry_attempts,
+    config.retry_base_delay,
+    config.retry_max_delay,
+    RetryBudget(max(config.threads * config.retry_budget_per_account, 1), config.retry_budget_ratio),
+)
+breakers = CircuitBreakers(
+    config.proxy_breaker_threshold, config.host_breaker_threshold, config.breaker_recovery_time
+)
+proxy_pool = ProxyPool(config.spare_proxies, ProxyStats())
+sessions = SessionPool(
+    config.max_per_proxy or config.max_threads * config.quests_concurrency,
+    config.request_timeout,
+    config.max_idle_sessions,
+)
+twitter_executor = (
+    ThreadPoolExecutor(config.twitter_threads, thread_name_prefix="twitter")
+    if config.twitter_threads
+    else None
+)
@@ -1,13 +1,11 @@
 from pydantic import BaseModel
 
 
+# Only the fields the bot reads are declared, the rest of the answer is skipped while parsing
 class QuestResult(BaseModel):
 
     class Steaks(BaseModel):
         total: float
-        perWeek: float
-        boost: dict
-        lastUnstake: dict
 
     earned: int
     steaks: Steaks
@@ -19,8 +17,6 @@ class QuestsList(BaseModel):
         id: int
         type: str
         name: str
-        description: str
-        steaks: int
 
     quests: list[QuestData]
 
@@ -31,7 +27,5 @@ class QuestsInfo(BaseModel):
     class QuestData(BaseModel):
         id: int
         completed: bool
-        completedAt: int | None = None
 
     rewards: list[QuestData]
-    ordinalsWallet: str | None = None
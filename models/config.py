@@ -2,29 +2,68 @@ from loguru import logger
 from pydantic import BaseModel, field_validator, HttpUrl
 
 
+def format_proxy(value: str) -> str:
+    proxy_values = value.split(":")
+    if len(proxy_values) != 4:
+        logger.error(
+            f"Proxy <<{value}>> is not in correct format | Need to be in format: <<ip:port:username:password>>"
+        )
+        exit(1)
+
+    proxy_url = f"http://{proxy_values[2]}:{proxy_values[3]}@{proxy_values[0]}:{proxy_values[1]}"
+    return proxy_url
+
+
 class Account(BaseModel):
     pk_or_mnemonic: str
     auth_token: str
     proxy: str
+    # Set once the account was moved to a spare proxy of the ProxyPool
+    spare_proxy: bool = False
 
     @field_validator("proxy", mode="before")
     def check_proxy(cls, value) -> str:
-        proxy_values = value.split(":")
-        if len(proxy_values) != 4:
-            logger.error(
-                f"Proxy <<{value}>> is not in correct format | Need to be in format: <<ip:port:username:password>>"
-            )
-            exit(1)
-
-        proxy_url = f"http://{proxy_values[2]}:{proxy_values[3]}@{proxy_values[0]}:{proxy_values[1]}"
-        return proxy_url
+        return format_proxy(value)
 
 
 class Config(BaseModel):
-    eth_rpc: HttpUrl
+    eth_rpc: HttpUrl | None = None
     threads: int
+    min_threads: int
+    max_threads: int
+    active_accounts: int
+    max_per_proxy: int
+    max_per_host: int
+    api_rps: float
+    api_burst: int
+    quests_cache_ttl: int
     delay_between_quests: int
+    quests_concurrency: int
+    quests_spacing: float
+    retry_attempts: int
+    retry_base_delay: float
+    retry_max_delay: float
+    retry_budget_per_account: int
+    retry_budget_ratio: float
+    proxy_breaker_threshold: int
+    host_breaker_threshold: int
+    breaker_recovery_time: float
+    proxy_check: bool
+    proxy_check_timeout: float
+    proxy_check_threads: int
+    proxy_rotation_threshold: int
+    prescan: bool
+    prescan_threads: int
+    twitter_threads: int
+    request_timeout: int
+    max_idle_sessions: int
+    auth_timeout: int
+    bind_timeout: int
+    quests_timeout: int
+    account_timeout: int
     accounts: list[Account]
+    spare_proxies: list[str] = []
+    resume: bool = False
 
 
 
@@ -35,3 +74,11 @@ class ExportAccountData(BaseModel):
     proxy: str
     ordinal_mnemonic: str | None = None
     ordinal_address: str | None = None
+    timed_out: bool = False
+
+
+class ProxyHealth(BaseModel):
+    proxy: str
+    alive: bool
+    latencies: dict[str, float] = {}
+    error: str | None = None
@@ -1,40 +1,75 @@
+import argparse
 import asyncio
 import sys
+import time
 
-from asyncio import WindowsSelectorEventLoopPolicy
 from loguru import logger
 
-from src.bot import MemeQuests
 from src.utils import show_dev_info, setup_logger
 
-from loader import config, semaphore
-from models import Account
-from src.utils import export_accounts
+from loader import config, sessions
+from src.runner import process_accounts, report_throughput
+from src.sharding import run_shards
+from src.proxies import preflight_proxies
+from src.prescan import prescan_accounts
+from src.utils import AccountsExporter
 
 
-async def run_safe(account: Account):
-    async with semaphore:
-        meme_quests = MemeQuests(account)
-        return await meme_quests.start()
+async def run(processes_count: int = 1):
+    show_dev_info()
+    logger.info(
+        f"\n\nMeme Bot started | Version: 1.0 | Total accounts: {len(config.accounts)} | Processes: {processes_count} | Threads: {config.threads} | Active accounts: {config.active_accounts} | Delay between quests: {config.delay_between_quests} sec | Resume: {config.resume}\n\n"
+    )
 
+    accounts = config.accounts
+    if config.proxy_check:
+        accounts = await preflight_proxies(accounts, config.spare_proxies)
+    if config.prescan:
+        accounts = await prescan_accounts(accounts)
 
-async def run():
-    show_dev_info()
+    exporter = AccountsExporter()
+    await exporter.start()
+    started_at = time.monotonic()
+
+    reporter = asyncio.create_task(report_throughput(lambda: exporter.exported_count, len(accounts), started_at))
+    try:
+        if processes_count > 1:
+            await run_shards(exporter, accounts, processes_count)
+        else:
+            await process_accounts(accounts, exporter.submit)
+    finally:
+        reporter.cancel()
+        await exporter.close()
+        await sessions.close()
+
+    elapsed = time.monotonic() - started_at
     logger.info(
-        f"\n\nMeme Bot started | Version: 1.0 | Total accounts: {len(config.accounts)} | Threads: {config.threads} | Delay between quests: {config.delay_between_quests} sec\n\n"
+        f"\n\nMeme Bot finished | Success: {exporter.success_count} | Failed: {exporter.failed_count} | Timed out: {exporter.timed_out_count} | Elapsed: {elapsed / 60:.2f} min | Throughput: {exporter.exported_count / elapsed * 60:.2f} accounts/min"
     )
 
-    tasks = [asyncio.create_task(run_safe(account)) for account in config.accounts]
-    export_accounts_data = await asyncio.gather(*tasks)
-    export_accounts(export_accounts_data)
 
-    logger.info("\n\nMeme Bot finished")
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Meme Bot")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="skip accounts, phases and quests already finished in previous runs",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="split accounts across N worker processes, each with its own event loop and threads",
+    )
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
+    args = parse_args()
+    config.resume = args.resume
     setup_logger()
 
     if sys.platform == "win32":
-        asyncio.set_event_loop_policy(WindowsSelectorEventLoopPolicy())
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
-    asyncio.run(run())
+    asyncio.run(run(max(args.processes, 1)))
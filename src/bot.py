@@ -1,22 +1,27 @@
 import asyncio
 import os
+import time
 import aiofiles
+import orjson
 import pyuseragents
 
+from functools import partial
 from typing import Literal
+from urllib.parse import urlsplit
 from loguru import logger
-from web3 import Web3, Account
+from pydantic import BaseModel, ValidationError
 
-from curl_cffi.requests import AsyncSession
+from curl_cffi.requests.errors import RequestsError
 from models import Account as MemeAccount, QuestResult, QuestsList, QuestsInfo, ExportAccountData
-from twitter_api import Account as TwitterAccount
-from twitter_api.models import BindAccountParamsV1
+from twitter_api import Account as BlockingTwitterAccount, AsyncAccount as TwitterAccount
+from twitter_api.models import BindAccountParamsV1, BindAccountDataV1
 
-from loader import config
+from loader import config, scheduler, concurrency, journal, tokens, twitter_binds, limits, api_rate_limiter, quests_cache, retry_policy, breakers, proxy_pool, sessions, twitter_executor
 from .wallet import Wallet
-from .exceptions.base import MemeError
-
-Account.enable_unaudited_hdwallet_features()
+from .exceptions.base import MemeError, CircuitOpenError, DeadlineExceeded
+from .deadline import deadline
+from .retry import RetryBudget
+from .breaker import is_transport_error, get_status_code
 
 
 class MemeQuests:
@@ -25,11 +30,23 @@ class MemeQuests:
     def __init__(self, account: MemeAccount):
         super().__init__()
         self.account = account
-        self.session = self.setup_session()
-        self.web3 = Web3(Web3.HTTPProvider(config.eth_rpc))
+        self.headers = {
+            "authority": "memestaking-api.stakeland.com",
+            "accept": "application/json",
+            "accept-language": "fr-FR,fr;q=0.9",
+            "origin": "https://www.stakeland.com",
+            "user-agent": pyuseragents.random(),
+        }
 
         self.wallet = Wallet(account.pk_or_mnemonic)
         self.ordinal_wallet = self.wallet.generate_p2tr_wallet()
+        self._ordinal_submitted = False
+
+        self._next_quest_at = 0.0
+        self.retry_budget = RetryBudget(config.retry_budget_per_account)
+        self._connection_failures = 0
+        self._cached_token = False
+        self._auth_lock = asyncio.Lock()
 
     @property
     def address(self) -> str:
@@ -41,22 +58,53 @@ class MemeQuests:
         proxy_str = f"{values[2]}:{values[3]}:{values[0]}:{values[1]}"
         return proxy_str
 
-    def setup_session(self):
-        session = AsyncSession()
-        session.headers = {
-            "authority": "memestaking-api.stakeland.com",
-            "accept": "application/json",
-            "accept-language": "fr-FR,fr;q=0.9",
-            "origin": "https://www.stakeland.com",
-            "user-agent": pyuseragents.random(),
-        }
-        session.proxies = {
-            "http": self.account.proxy,
-            "https": self.account.proxy,
-        }
-        session.verify = False
+    def handle_connection_failure(self, error: Exception):
+        if not is_transport_error(error):
+            return
 
-        return session
+        self._connection_failures += 1
+        if self._connection_failures < config.proxy_rotation_threshold:
+            return
+
+        self._connection_failures = 0
+        proxy_pool.record_failure(self.account.proxy)
+        self.rotate_proxy()
+
+    def rotate_proxy(self) -> bool:
+        replacement = proxy_pool.rotate(self.account.proxy)
+        if not replacement:
+            return False
+
+        if self.account.spare_proxy:
+            proxy_pool.release(self.account.proxy)
+
+        self.account.proxy = replacement
+        self.account.spare_proxy = True
+        return True
+
+    async def check_breakers(self, *hosts: str):
+        try:
+            breakers.check_proxy(self.account.proxy)
+        except CircuitOpenError:
+            if not self.rotate_proxy():
+                raise
+
+        # A dead proxy only concerns this account, a host outage concerns all of them: park until it recovers
+        while True:
+            try:
+                breakers.check_hosts(*hosts)
+                return
+            except CircuitOpenError as error:
+                logger.warning(f"Account: {self.address} | {error} | Waiting {error.retry_after:.1f} sec..")
+                await scheduler.sleep(error.retry_after)
+
+    async def with_retries(self, operation, description: str):
+        def on_retry(error: Exception, delay: float):
+            logger.warning(
+                f"Account: {self.address} | {description} failed | Error: {error} | Retrying in {delay:.1f} sec.."
+            )
+
+        return await retry_policy.run(operation, self.retry_budget, scheduler.sleep, on_retry)
 
     async def send_request(
         self,
@@ -66,6 +114,49 @@ class MemeQuests:
         params: dict = None,
         url: str = None,
         verify: bool = True,
+        model: type[BaseModel] = None,
+        reauth: bool = True,
+    ):
+        async def send():
+            return await self.with_retries(
+                lambda: self._send_request(request_type, method, json_data, params, url, verify, model),
+                f"Request {method or url}",
+            )
+
+        authorization = self.headers.get("authorization")
+        try:
+            return await send()
+
+        except RequestsError as error:
+            if get_status_code(error) != 401 or not reauth:
+                raise
+
+            # Parallel quests can all hit 401 with the same stale token, only one re-authenticates.
+            # Nobody holds a slot while waiting for the lock, the re-authentication takes its own
+            async with scheduler.released():
+                async with self._auth_lock:
+                    if self.headers.get("authorization") == authorization:
+                        if not self._cached_token:
+                            raise
+
+                        logger.warning(f"Account: {self.address} | Cached access token rejected | Re-authenticating..")
+                        tokens.delete(self.address)
+                        self._cached_token = False
+                        async with scheduler.sub_slot():
+                            if not await self.auth(delay=False):
+                                raise
+
+            return await send()
+
+    async def _send_request(
+        self,
+        request_type: Literal["POST", "GET"],
+        method: str | None,
+        json_data: dict | None,
+        params: dict | None,
+        url: str | None,
+        verify: bool,
+        model: type[BaseModel] | None,
     ):
         def _verify_response(_response: dict) -> dict:
             if "success" in _response:
@@ -74,28 +165,48 @@ class MemeQuests:
 
             return _response
 
-        if request_type == "POST":
-            if not url:
-                response = await self.session.post(
-                    f"{self.API_URL}{method}", json=json_data, params=params
-                )
+        request_url = url or f"{self.API_URL}{method}"
+        host = urlsplit(request_url).hostname
+        await self.check_breakers(host)
+        await api_rate_limiter.acquire()
 
-            else:
-                response = await self.session.post(url, json=json_data, params=params)
+        async with limits.hold_url(self.account.proxy, request_url), sessions.lease(self.account.proxy) as session:
+            started_at = time.monotonic()
+            try:
+                if request_type == "POST":
+                    response = await session.post(
+                        request_url, json=json_data, params=params, headers=self.headers
+                    )
+                else:
+                    response = await session.get(request_url, params=params, headers=self.headers)
 
-        else:
-            if not url:
-                response = await self.session.get(
-                    f"{self.API_URL}{method}", params=params
-                )
+            except Exception as error:
+                concurrency.observe(time.monotonic() - started_at, success=False)
+                breakers.record(self.account.proxy, (host,), error=error)
+                self.handle_connection_failure(error)
+                raise
+
+        breakers.record(self.account.proxy, (host,), status_code=response.status_code)
+        self._connection_failures = 0
+        concurrency.observe(
+            time.monotonic() - started_at,
+            success=response.status_code < 500 and response.status_code != 429,
+        )
+        if not response.ok:
+            raise RequestsError(f"HTTP Error {response.status_code}: {response.reason}", response=response)
 
-            else:
-                response = await self.session.get(url, params=params)
+        if model is not None:
+            # Decode straight from bytes into the model, error answers don't match it
+            try:
+                return model.model_validate_json(response.content)
+            except ValidationError:
+                if verify:
+                    _verify_response(orjson.loads(response.content))
+                raise
 
-        response.raise_for_status()
         if verify:
-            return _verify_response(response.json())
-        return response.json()
+            return _verify_response(orjson.loads(response.content))
+        return orjson.loads(response.content)
 
     async def wallet_info(self) -> dict:
         response = await self.send_request(
@@ -103,179 +214,252 @@ class MemeQuests:
         )
         return response
 
-    async def auth(self) -> bool:
-        for _ in range(3):
-            try:
-                signature_data = self.wallet.get_signature_data()
+    async def auth(self, delay: bool = True) -> bool:
+        access_token = tokens.get(self.address)
+        if access_token:
+            self.headers["authorization"] = f"Bearer {access_token}"
+            self._cached_token = True
+            logger.success(f"Account: {self.address} | Authenticated with cached access token")
+            return True
 
-                json_data = {
-                    "address": self.address,
-                    "message": signature_data.message,
-                    "signature": signature_data.signature,
-                }
+        try:
+            signature_data = self.wallet.get_signature_data()
 
-                response = await self.send_request(
-                    request_type="POST", method="/wallet/auth", json_data=json_data
-                )
-                if not response.get("accessToken"):
-                    raise Exception("Auth failed")
+            json_data = {
+                "address": self.address,
+                "message": signature_data.message,
+                "signature": signature_data.signature,
+            }
 
-                self.session.headers["authorization"] = (
-                    f"Bearer {response['accessToken']}"
-                )
-                logger.success(f"Account: {self.address} | Authenticated successfully")
-                await self.process_sleep()
-                return True
+            response = await self.send_request(
+                request_type="POST", method="/wallet/auth", json_data=json_data, reauth=False
+            )
+            if not response.get("accessToken"):
+                raise Exception("Auth failed")
 
-            except Exception as error:
-                logger.error(
-                    f"Account: {self.address} | Failed to authenticate | Error: {error} | Retrying.."
-                )
+            self.headers["authorization"] = f"Bearer {response['accessToken']}"
+            tokens.save(self.address, response["accessToken"])
+            logger.success(f"Account: {self.address} | Authenticated successfully")
+            if delay:
                 await self.process_sleep()
+            return True
 
-        logger.error(
-            f"Account: {self.address} | Failed to authenticate | Max retries exceeded"
-        )
+        except Exception as error:
+            logger.error(
+                f"Account: {self.address} | Failed to authenticate | Error: {error}"
+            )
+            return False
 
     async def complete_connect_quest(self) -> QuestResult:
-        response = await self.send_request(
-            request_type="POST", method="/farming/quest/connect"
+        return await self.send_request(
+            request_type="POST", method="/farming/quest/connect", model=QuestResult
         )
-        return QuestResult(**response)
 
     async def submit_ordinal_wallet(self) -> QuestResult:
-        response = await self.send_request(
+        # From here on the address may be registered, so its mnemonic has to be exported
+        self._ordinal_submitted = True
+        return await self.send_request(
             request_type="POST",
             method="/farming/quest/ordinals",
             json_data={"ordinals": self.ordinal_wallet.address},
+            model=QuestResult,
         )
-        return QuestResult(**response)
 
     async def get_quests(self) -> QuestsList:
-        response = await self.send_request(request_type="GET", method="/farming/quests")
-        return QuestsList(**response)
+        quests = quests_cache.get_cached("quests")
+        if quests is not None:
+            return quests
+
+        async def load_quests() -> QuestsList:
+            async with scheduler.sub_slot():
+                return await self.send_request(request_type="GET", method="/farming/quests", model=QuestsList)
+
+        # Accounts waiting for another account's load must not sit on a slot that load may need back
+        async with scheduler.released():
+            return await quests_cache.get("quests", load_quests)
 
     async def quests_info(self) -> QuestsInfo:
-        response = await self.send_request(request_type="GET", method=f"/farming/info/{self.address}")
-        return QuestsInfo(**response)
+        return await self.send_request(
+            request_type="GET", method=f"/farming/info/{self.address}", model=QuestsInfo
+        )
 
     async def complete_quest(self, quest_id: int, quest_type: str) -> QuestResult:
-        response = await self.send_request(
+        return await self.send_request(
             request_type="POST",
             method=f"/farming/quest/{quest_type}",
             json_data={"questId": quest_id},
+            model=QuestResult,
         )
-        return QuestResult(**response)
 
     async def process_sleep(self):
         logger.debug(
             f"Account: {self.address} | Waiting for {config.delay_between_quests} sec..."
         )
-        await asyncio.sleep(config.delay_between_quests)
+        await scheduler.sleep(config.delay_between_quests)
+
+    async def wait_quest_turn(self):
+        # The turn is reserved before the first await, so parallel quests never wait on each other
+        now = time.monotonic()
+        start_at = max(now, self._next_quest_at)
+        self._next_quest_at = start_at + config.quests_spacing
+        if start_at > now:
+            await scheduler.sleep(start_at - now)
 
-    async def complete_quests(self):
+    async def process_quest(self, quest: QuestsList.QuestData) -> bool:
+        try:
+            if quest.id == 1:
+                quest_result = await self.complete_connect_quest()
+            elif quest.id == 0:
+                quest_result = await self.submit_ordinal_wallet()
+            else:
+                quest_result = await self.complete_quest(quest.id, quest.type)
+
+            logger.success(
+                f"Account: {self.address} | Quest completed: {quest.name} | Earned: {quest_result.earned} | Steaks: {quest_result.steaks.total}"
+            )
+            journal.record(self.address, "quest", quest.id)
+            return True
+
+        except MemeError as error:
+            logger.error(
+                f"Account: {self.address} | Quest failed: {quest.name} | Meme Error: {error.error_message()} | Skipped..."
+            )
+            return False
+
+        except Exception as error:
+            logger.error(
+                f"Account: {self.address} | Quest failed: {quest.name} | Unknown Error: {error} | Skipped..."
+            )
+            return False
+
+    async def process_independent_quest(self, quest: QuestsList.QuestData, semaphore: asyncio.Semaphore) -> bool:
+        async with semaphore:
+            # Slots only go to quests whose turn has come
+            await self.wait_quest_turn()
+            async with scheduler.sub_slot():
+                return await self.process_quest(quest)
+
+    async def complete_quests(self) -> bool:
         quests = await self.get_quests()
-        quests_info = await self.quests_info()
-        completed_quests: list[int] = [quest.id for quest in quests_info.rewards if quest.completed]
+        completed_quests: set[int] = journal.completed_quests(self.address) if config.resume else set()
+
+        if any(quest.id not in completed_quests and quest.id != 9 for quest in quests.quests):
+            quests_info = await self.quests_info()
+            for quest in quests_info.rewards:
+                if quest.completed:
+                    journal.record(self.address, "quest", quest.id)
+                    completed_quests.add(quest.id)
 
+        # The ordinals (0) and connect (1) quests keep their order, the rest don't depend on each other
+        dependent_quests, independent_quests = [], []
         for quest in quests.quests:
+            if quest.id in completed_quests:
+                logger.warning(
+                    f"Account: {self.address} | Quest skipped: {quest.name} | Reason: Already completed"
+                )
 
-            while True:
-                try:
-                    if quest.id in completed_quests:
-                        logger.warning(
-                            f"Account: {self.address} | Quest skipped: {quest.name} | Reason: Already completed"
-                        )
-
-                        if quest.id == 0:
-                            self.ordinal_wallet = None
-
-                        break
-
-                    if quest.id == 1:
-                        quest_result = await self.complete_connect_quest()
-                    elif quest.id == 0:
-                        quest_result = await self.submit_ordinal_wallet()
-                    elif quest.id == 9:
-                        logger.warning(f"Account: {self.address} | Quest skipped: {quest.name}")
-                        break
-                    else:
-                        quest_result = await self.complete_quest(quest.id, quest.type)
-
-                    logger.success(
-                        f"Account: {self.address} | Quest completed: {quest.name} | Earned: {quest_result.earned} | Steaks: {quest_result.steaks.total}"
-                    )
-                    break
-
-                except MemeError as error:
-                    if error.error_message() == "not_found":
-                        logger.warning(
-                            f"Account: {self.address} | Quest failed: {quest.name} | Meme Error: {error.error_message()} | Retrying.."
-                        )
-                        await self.process_sleep()
-
-                    else:
-                        logger.error(
-                            f"Account: {self.address} | Quest failed: {quest.name} | Meme Error: {error.error_message()} | Skipped..."
-                        )
-                        break
-
-                except Exception as error:
-                    logger.error(
-                        f"Account: {self.address} | Quest failed: {quest.name} | Unknown Error: {error} | Retrying.."
-                    )
-                    await self.process_sleep()
+                if quest.id == 0:
+                    self.ordinal_wallet = None
 
-            await self.process_sleep()
+            elif quest.id == 9:
+                logger.warning(f"Account: {self.address} | Quest skipped: {quest.name}")
 
-    async def bind_twitter(self) -> bool:
-        for _ in range(3):
+            elif quest.id in (0, 1):
+                dependent_quests.append(quest)
+            else:
+                independent_quests.append(quest)
+
+        results = []
+        for quest in dependent_quests:
+            await self.wait_quest_turn()
+            results.append(await self.process_quest(quest))
+
+        # Every independent quest takes its own slot (and gives it back while backing off),
+        # so the account's slot is returned while it only waits for them
+        semaphore = asyncio.Semaphore(config.quests_concurrency)
+        async with scheduler.released():
+            results += await asyncio.gather(
+                *(self.process_independent_quest(quest, semaphore) for quest in independent_quests)
+            )
+        return all(results)
+
+    def bind_twitter_account_blocking(self, bind_data: BindAccountParamsV1) -> BindAccountDataV1:
+        with BlockingTwitterAccount.run(
+            auth_token=self.account.auth_token, proxy=self.account.proxy, oauth_only=True
+        ) as account:
+            return account.bind_account_v1(bind_data)
+
+    async def bind_twitter_account(self, bind_data: BindAccountParamsV1) -> BindAccountDataV1:
+        if twitter_executor:
+            return await asyncio.get_running_loop().run_in_executor(
+                twitter_executor, partial(self.bind_twitter_account_blocking, bind_data)
+            )
+
+        async with await TwitterAccount.run(
+            auth_token=self.account.auth_token, proxy=self.account.proxy, oauth_only=True
+        ) as account, sessions.lease(self.account.proxy) as session:
+            return await account.bind_account_v1(bind_data, session)
+
+    async def authorize_twitter(self) -> BindAccountDataV1:
+        bind_url = "https://memestaking-api.stakeland.com/farming/twitter/auth?callback=https://www.stakeland.com/farming"
+        twitter_hosts = ("twitter.com", "api.twitter.com")
+        await self.check_breakers(*twitter_hosts)
+
+        async with limits.hold(
+            self.account.proxy, *twitter_hosts, "memestaking-api.stakeland.com"
+        ):
             try:
-                bind_url = "https://memestaking-api.stakeland.com/farming/twitter/auth?callback=https://www.stakeland.com/farming"
-                account = TwitterAccount.run(
-                    auth_token=self.account.auth_token, proxy=self.account.proxy
-                )
+                bound_data = await self.bind_twitter_account(BindAccountParamsV1(url=bind_url))
+
+            except Exception as error:
+                breakers.record(self.account.proxy, twitter_hosts, error=error)
+                self.handle_connection_failure(error)
+                raise
 
-                bind_data = BindAccountParamsV1(url=bind_url)
-                bound_data = account.bind_account_v1(bind_data)
+        breakers.record(self.account.proxy, twitter_hosts)
+        return bound_data
 
-                json_data = {
-                    "oauth_token": bound_data.oauth_token,
-                    "oauth_verifier": bound_data.oauth_verifier,
-                }
+    async def bind_twitter(self) -> bool:
+        try:
+            bound_data = await self.with_retries(self.authorize_twitter, "Twitter authorization")
+
+            json_data = {
+                "oauth_token": bound_data.oauth_token,
+                "oauth_verifier": bound_data.oauth_verifier,
+            }
+
+            response = await self.send_request(
+                request_type="POST",
+                method="/farming/twitter/auth",
+                json_data=json_data,
+                verify=False,
+            )
 
-                response = await self.send_request(
-                    request_type="POST",
-                    method="/farming/twitter/auth",
-                    json_data=json_data,
-                    verify=False,
+            if not response["success"]:
+                if response.get("error") != "already_bound":
+                    raise MemeError({"error_message": response.get("error")})
+                logger.warning(
+                    f"Account: {self.address} | Twitter account already bound"
+                )
+            else:
+                logger.success(
+                    f"Account: {self.address} | Twitter account bound successfully"
                 )
 
-                if not response["success"]:
-                    if response.get("error") != "already_bound":
-                        raise Exception(
-                            f"Failed to bind twitter account | Error: {response.get('error')}"
-                        )
-                    logger.warning(
-                        f"Account: {self.address} | Twitter account already bound"
-                    )
-                else:
-                    logger.success(
-                        f"Account: {self.address} | Twitter account bound successfully"
-                    )
+            twitter_binds.record(self.address, self.account.auth_token)
+            await self.process_sleep()
+            return True
 
-                await self.process_sleep()
-                return True
+        except MemeError as error:
+            logger.error(
+                f"Account: {self.address} | Failed to bind twitter account | Meme Error: {error.error_message()}"
+            )
 
-            except Exception as error:
-                logger.error(
-                    f"Account: {self.address} | Failed to bind twitter account | Error: {error} | Retrying.."
-                )
-                await self.process_sleep()
+        except Exception as error:
+            logger.error(
+                f"Account: {self.address} | Failed to bind twitter account | Error: {error}"
+            )
 
-        logger.error(
-            f"Account: {self.address} | Failed to bind twitter account | Max retries exceeded"
-        )
         return False
 
     # async def export_account(self, success: bool = True) -> None:
@@ -295,41 +479,72 @@ class MemeQuests:
     #             f"{self.account.auth_token}|{self.account.pk_or_mnemonic}|{self.get_proxy}|{self.ordinal_wallet.address}:{self.ordinal_wallet.mnemonic}\n"
     #         )
 
-    async def export_account(self, success: bool = True) -> ExportAccountData:
-        if success:
-            logger.info(f"Account: {self.address} | Finished successfully")
+    async def export_account(self, success: bool = True, timed_out: bool = False) -> ExportAccountData:
+        if timed_out or not success:
+            # The ordinals quest is journaled once submitted, a later run won't regenerate the wallet
+            ordinal_wallet = self.ordinal_wallet if self._ordinal_submitted else None
+            if timed_out:
+                logger.info(f"Account: {self.address} | Finished with timeout")
+            else:
+                logger.info(f"Account: {self.address} | Finished with error")
+
             return ExportAccountData(
-                success=True,
+                success=False,
+                timed_out=timed_out,
                 pk_or_mnemonic=self.account.pk_or_mnemonic,
                 auth_token=self.account.auth_token,
                 proxy=self.get_proxy,
-                ordinal_mnemonic=self.ordinal_wallet.mnemonic if self.ordinal_wallet else None,
-                ordinal_address=self.ordinal_wallet.address if self.ordinal_wallet else None,
+                ordinal_mnemonic=ordinal_wallet.mnemonic if ordinal_wallet else None,
+                ordinal_address=ordinal_wallet.address if ordinal_wallet else None,
             )
 
         else:
-            logger.info(f"Account: {self.address} | Finished with error")
+            logger.info(f"Account: {self.address} | Finished successfully")
             return ExportAccountData(
-                success=False,
+                success=True,
                 pk_or_mnemonic=self.account.pk_or_mnemonic,
                 auth_token=self.account.auth_token,
                 proxy=self.get_proxy,
-                ordinal_mnemonic=None,
-                ordinal_address=None,
+                ordinal_mnemonic=self.ordinal_wallet.mnemonic if self.ordinal_wallet else None,
+                ordinal_address=self.ordinal_wallet.address if self.ordinal_wallet else None,
             )
 
 
-    async def start(self) -> ExportAccountData:
+    async def start(self) -> ExportAccountData | None:
         try:
-            if not await self.auth():
-                return await self.export_account(success=False)
+            completed_phases = journal.completed_phases(self.address) if config.resume else set()
+            if "finished" in completed_phases:
+                logger.info(f"Account: {self.address} | Skipped | Reason: Finished in previous run")
+                return None
+
+            async with deadline(config.account_timeout, "Account"):
+                async with deadline(config.auth_timeout, "Auth"):
+                    if not await self.auth():
+                        return await self.export_account(success=False)
+
+                # Journals written before the binds table only have the "bind" phase, without the auth_token
+                if twitter_binds.is_bound(self.address, self.account.auth_token) or "bind" in completed_phases:
+                    logger.info(f"Account: {self.address} | Twitter bind skipped | Reason: Already bound")
+                else:
+                    async with deadline(config.bind_timeout, "Twitter bind"):
+                        if not await self.bind_twitter():
+                            return await self.export_account(success=False)
 
-            if not await self.bind_twitter():
-                return await self.export_account(success=False)
+                async with deadline(config.quests_timeout, "Quests"):
+                    finished = await self.complete_quests()
 
-            await self.complete_quests()
+            if finished:
+                journal.record(self.address, "finished")
             return await self.export_account(success=True)
 
+        except DeadlineExceeded as error:
+            logger.error(f"Account: {self.address} | Timed out | Error: {error}")
+            return await self.export_account(timed_out=True)
+
         except Exception as error:
             logger.error(f"Account: {self.address} | Unknown error | Error: {error}")
             return await self.export_account(success=False)
+
+        finally:
+            if self.account.spare_proxy:
+                proxy_pool.release(self.account.proxy)
@@ -0,0 +1,155 @@
+import time
+
+from curl_cffi import CurlError
+from curl_cffi.requests.errors import RequestsError
+from loguru import logger
+
+from .exceptions.base import CircuitOpenError
+
+
+class CircuitBreaker:
+    """
+    Classic closed / open / half-open breaker.
+
+    After `failure_threshold` consecutive failures the breaker opens and refuses
+    requests for `recovery_time` seconds, then lets a single probe through: a
+    successful probe closes it again, a failed one re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, name: str, failure_threshold: int, recovery_time: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at = 0.0
+
+    def allow(self) -> bool:
+        if self.state == self.CLOSED:
+            return True
+
+        now = time.monotonic()
+        if self.state == self.OPEN and now - self._opened_at >= self.recovery_time:
+            self.state = self.HALF_OPEN
+            self._probe_started_at = now
+            return True
+
+        if self.state == self.HALF_OPEN and now - self._probe_started_at >= self.recovery_time:
+            # The previous probe never reported back
+            self._probe_started_at = now
+            return True
+
+        return False
+
+    def retry_after(self) -> float:
+        """Seconds until allow() lets the next request through."""
+        if self.state == self.CLOSED:
+            return 0.0
+
+        started_at = self._opened_at if self.state == self.OPEN else self._probe_started_at
+        return max(0.0, started_at + self.recovery_time - time.monotonic())
+
+    def record_success(self) -> None:
+        if self.state != self.CLOSED:
+            logger.info(f"Circuit breaker closed: {self.name}")
+
+        self.state = self.CLOSED
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self.state == self.HALF_OPEN or (
+            self.state == self.CLOSED and self._failures >= self.failure_threshold
+        ):
+            if self.state == self.CLOSED:
+                logger.warning(
+                    f"Circuit breaker opened: {self.name} | {self._failures} failures in a row | Requests paused for {self.recovery_time} sec"
+                )
+
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+
+class CircuitBreakers:
+    """Breakers keyed by proxy and by upstream host."""
+
+    def __init__(self, proxy_threshold: int, host_threshold: int, recovery_time: float):
+        self.proxy_threshold = proxy_threshold
+        self.host_threshold = host_threshold
+        self.recovery_time = recovery_time
+
+        self._proxies: dict[str, CircuitBreaker] = {}
+        self._hosts: dict[str, CircuitBreaker] = {}
+
+    def proxy(self, proxy: str) -> CircuitBreaker:
+        breaker = self._proxies.get(proxy)
+        if breaker is None:
+            breaker = self._proxies[proxy] = CircuitBreaker(
+                f"proxy {proxy.split('@')[-1]}", self.proxy_threshold, self.recovery_time
+            )
+
+        return breaker
+
+    def host(self, host: str) -> CircuitBreaker:
+        breaker = self._hosts.get(host)
+        if breaker is None:
+            breaker = self._hosts[host] = CircuitBreaker(
+                f"host {host}", self.host_threshold, self.recovery_time
+            )
+
+        return breaker
+
+    def check(self, proxy: str, *hosts: str) -> None:
+        self.check_proxy(proxy)
+        self.check_hosts(*hosts)
+
+    def check_proxy(self, proxy: str) -> None:
+        if not self.proxy(proxy).allow():
+            raise CircuitOpenError(f"Proxy {proxy.split('@')[-1]} is unavailable (circuit breaker open)")
+
+    def check_hosts(self, *hosts: str) -> None:
+        for host in hosts:
+            breaker = self.host(host)
+            if not breaker.allow():
+                raise CircuitOpenError(f"Host {host} is unavailable (circuit breaker open)", breaker.retry_after())
+
+    def record(self, proxy: str, hosts: tuple[str, ...], error: Exception | None = None, status_code: int | None = None) -> None:
+        proxy_failed = error is not None and is_transport_error(error) or status_code == 407
+        host_failed = status_code is not None and (status_code >= 500 or status_code == 429)
+
+        proxy_breaker = self.proxy(proxy)
+        if proxy_failed:
+            proxy_breaker.record_failure()
+        else:
+            proxy_breaker.record_success()
+
+        if proxy_failed or (error is not None and status_code is None):
+            # The upstream was never reached or didn't answer with a status, its health is unknown
+            return
+
+        for host in hosts:
+            if host_failed:
+                self.host(host).record_failure()
+            else:
+                self.host(host).record_success()
+
+
+def get_status_code(error: Exception) -> int | None:
+    # curl_cffi attaches an empty response with status 0 to connection errors
+    if isinstance(error, RequestsError) and error.response is not None and error.response.status_code:
+        return error.response.status_code
+
+    return None
+
+
+def is_transport_error(error: Exception) -> bool:
+    if get_status_code(error) is not None:
+        return False
+
+    return isinstance(error, (CurlError, ConnectionError, TimeoutError))
@@ -0,0 +1,53 @@
+import asyncio
+import time
+
+from typing import Any, Awaitable, Callable
+
+
+class SingleFlightCache:
+    """
+    Process-wide TTL cache where concurrent misses for the same key share one load.
+
+    If the shared load fails, every waiter falls back to its own load instead of
+    inheriting an error caused by another account's proxy.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._values: dict[str, tuple[float, Any]] = {}
+        self._in_flight: dict[str, asyncio.Future] = {}
+
+    def get_cached(self, key: str) -> Any | None:
+        entry = self._values.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        return None
+
+    async def get(self, key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        value = self.get_cached(key)
+        if value is not None:
+            return value
+
+        future = self._in_flight.get(key)
+        if future is not None:
+            await asyncio.wait([future])
+            if not future.cancelled() and future.exception() is None:
+                return future.result()
+
+            return await load()
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            value = await load()
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+
+        if self.ttl:
+            self._values[key] = (time.monotonic() + self.ttl, value)
+        future.set_result(value)
+        return value
@@ -0,0 +1,40 @@
+import asyncio
+
+from contextlib import asynccontextmanager
+
+from .exceptions.base import DeadlineExceeded
+
+
+@asynccontextmanager
+async def deadline(timeout: float, phase: str):
+    """
+    Cancels the block once `timeout` seconds pass and raises DeadlineExceeded instead.
+
+    Unlike asyncio.wait_for the block keeps running in the current task, so the
+    scheduler slot it holds (a context variable) is released exactly once.
+    0 disables the deadline.
+    """
+    if not timeout:
+        yield
+        return
+
+    task = asyncio.current_task()
+    expired = False
+
+    def expire():
+        nonlocal expired
+        expired = True
+        task.cancel()
+
+    handle = asyncio.get_running_loop().call_later(timeout, expire)
+    try:
+        yield
+    except asyncio.CancelledError:
+        if expired:
+            # Our own cancel request is consumed here, don't leave it counted on the task
+            if hasattr(task, "uncancel"):
+                task.uncancel()
+            raise DeadlineExceeded(phase, timeout) from None
+        raise
+    finally:
+        handle.cancel()
@@ -4,3 +4,20 @@ class MemeError(Exception):
 
     def error_message(self) -> str:
         return self.error_dict.get("error_message")
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is refused because the circuit breaker of its proxy or host is open"""
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class DeadlineExceeded(Exception):
+    """Raised when an account or one of its phases runs past its configured deadline"""
+
+    def __init__(self, phase: str, timeout: float):
+        super().__init__(f"{phase} deadline of {timeout} sec exceeded")
+        self.phase = phase
+        self.timeout = timeout
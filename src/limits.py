@@ -0,0 +1,81 @@
+import asyncio
+import time
+
+from contextlib import AsyncExitStack, asynccontextmanager
+from urllib.parse import urlsplit
+
+
+class KeyedLimiter:
+    """Separate concurrency limit for every key (proxy, upstream host, ...). A limit of 0 disables it."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def semaphore(self, key: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(key)
+        if semaphore is None:
+            semaphore = self._semaphores[key] = asyncio.Semaphore(self.limit)
+
+        return semaphore
+
+    @asynccontextmanager
+    async def hold(self, key: str):
+        if not self.limit or not key:
+            yield
+            return
+
+        async with self.semaphore(key):
+            yield
+
+
+class RequestLimits:
+    """Per-proxy and per-upstream-host limits, always taken in the same order."""
+
+    def __init__(self, max_per_proxy: int, max_per_host: int):
+        self.proxies = KeyedLimiter(max_per_proxy)
+        self.hosts = KeyedLimiter(max_per_host)
+
+    @asynccontextmanager
+    async def hold(self, proxy: str, *hosts: str):
+        async with AsyncExitStack() as stack:
+            await stack.enter_async_context(self.proxies.hold(proxy))
+            for host in sorted(set(hosts)):
+                await stack.enter_async_context(self.hosts.hold(host))
+
+            yield
+
+    def hold_url(self, proxy: str, url: str):
+        return self.hold(proxy, urlsplit(url).hostname)
+
+
+class TokenBucket:
+    """Shared requests-per-second budget with burst allowance. A rate of 0 disables it."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def scale(self, factor: float) -> None:
+        self.rate *= factor
+        self.burst = max(int(self.burst * factor), 1)
+        self._tokens = min(self._tokens, self.burst)
+
+    async def acquire(self) -> None:
+        if not self.rate:
+            return
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
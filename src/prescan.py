@@ -0,0 +1,77 @@
+import asyncio
+
+from loguru import logger
+
+from loader import config, journal, wallet_addresses, api_rate_limiter, sessions
+from models import Account, QuestsInfo
+from .wallet import Wallet
+
+
+FARMING_INFO_URL = "https://memestaking-api.stakeland.com/farming/info/{address}"
+
+# Quests the bot never completes, they don't count as remaining work
+SKIPPED_QUESTS = {9}
+
+
+async def get_address(account: Account) -> str:
+    address = wallet_addresses.get(account.pk_or_mnemonic)
+    if not address:
+        address = await asyncio.to_thread(Wallet.get_address, account.pk_or_mnemonic)
+        wallet_addresses.save(account.pk_or_mnemonic, address)
+
+    return address
+
+
+def classify(quests_info: QuestsInfo) -> str:
+    remaining = [
+        quest for quest in quests_info.rewards
+        if not quest.completed and quest.id not in SKIPPED_QUESTS
+    ]
+    if quests_info.rewards and not remaining:
+        return "done"
+
+    if any(quest.completed for quest in quests_info.rewards):
+        return "partial"
+
+    return "new"
+
+
+async def prescan_accounts(accounts: list[Account]) -> list[Account]:
+    """
+    Fetches /farming/info for every account before the run and drops the accounts
+    that have no quests left, so they skip wallet setup, auth and the twitter bind.
+    Accounts that could not be checked are kept.
+    """
+    logger.info(f"Checking quests progress of {len(accounts)} accounts..")
+
+    statuses: list[str] = ["unknown"] * len(accounts)
+    indexes = iter(range(len(accounts)))
+
+    async def scan(index: int):
+        account = accounts[index]
+        address = await get_address(account)
+
+        await api_rate_limiter.acquire()
+        # Pooled sessions already time out after request_timeout
+        async with sessions.lease(account.proxy) as session:
+            response = await session.get(FARMING_INFO_URL.format(address=address))
+        if not response.ok:
+            return
+
+        statuses[index] = classify(QuestsInfo.model_validate_json(response.content))
+        if statuses[index] == "done":
+            journal.record(address, "finished")
+
+    async def worker():
+        for index in indexes:
+            try:
+                await scan(index)
+            except Exception as error:
+                logger.debug(f"Failed to check quests progress of account #{index + 1} | Error: {error}")
+
+    await asyncio.gather(*(worker() for _ in range(min(config.prescan_threads, len(accounts)))))
+
+    logger.info(
+        f"Quests progress checked | Done: {statuses.count('done')} | Partially done: {statuses.count('partial')} | New: {statuses.count('new')} | Unknown: {statuses.count('unknown')}"
+    )
+    return [account for account, status in zip(accounts, statuses) if status != "done"]
@@ -0,0 +1,76 @@
+import asyncio
+import time
+
+from loguru import logger
+
+from loader import config, proxy_pool, sessions
+from models import Account, ProxyHealth
+from .proxy_pool import mask_proxy
+
+
+PROXY_CHECK_URLS = {
+    "memestaking-api.stakeland.com": "https://memestaking-api.stakeland.com/farming/quests",
+    "twitter.com": "https://twitter.com/",
+}
+
+
+async def check_proxy(proxy: str, semaphore: asyncio.Semaphore) -> ProxyHealth:
+    async with semaphore:
+        latencies = {}
+        # Pooled session, the connections opened by the check are reused by the accounts
+        # as long as the session stays among the idle ones kept open
+        async with sessions.lease(proxy) as session:
+            for host, url in PROXY_CHECK_URLS.items():
+                started_at = time.monotonic()
+                try:
+                    await session.get(url, timeout=config.proxy_check_timeout)
+                except Exception as error:
+                    return ProxyHealth(proxy=proxy, alive=False, latencies=latencies, error=f"{host}: {error}")
+
+                latencies[host] = time.monotonic() - started_at
+
+        return ProxyHealth(proxy=proxy, alive=True, latencies=latencies)
+
+
+async def preflight_proxies(accounts: list[Account], spare_proxies: list[str]) -> list[Account]:
+    """
+    Probes every distinct proxy once, gives accounts with a dead proxy a working spare one
+    and moves accounts that are left without a working proxy to the end of the queue.
+    """
+    proxies = list(dict.fromkeys([account.proxy for account in accounts] + spare_proxies))
+    logger.info(f"Checking {len(proxies)} proxies..")
+
+    semaphore = asyncio.Semaphore(config.proxy_check_threads)
+    results = await asyncio.gather(*(check_proxy(proxy, semaphore) for proxy in proxies))
+
+    for result in results:
+        if not result.alive:
+            logger.warning(f"Proxy {mask_proxy(result.proxy)} is dead | Error: {result.error}")
+            proxy_pool.record_failure(result.proxy)
+
+    dead_proxies = {result.proxy for result in results if not result.alive}
+
+    ready, deferred = [], []
+    moved_count = 0
+    for account in accounts:
+        if account.proxy not in dead_proxies:
+            ready.append(account)
+            continue
+
+        # Through the pool, so runtime rotations see how many accounts each spare already has
+        spare = proxy_pool.acquire(exclude=dead_proxies)
+        if spare:
+            moved_count += 1
+            logger.info(f"Proxy {mask_proxy(account.proxy)} replaced with spare proxy {mask_proxy(spare)}")
+            account.proxy = spare
+            account.spare_proxy = True
+            ready.append(account)
+
+        else:
+            deferred.append(account)
+
+    alive_count = sum(result.alive for result in results)
+    logger.info(
+        f"Proxies checked | Alive: {alive_count}/{len(proxies)} | Accounts moved to spare proxies: {moved_count} | Accounts deferred: {len(deferred)}"
+    )
+    return ready + deferred
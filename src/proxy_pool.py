@@ -0,0 +1,59 @@
+from loguru import logger
+
+from .storage import ProxyStats
+
+
+def mask_proxy(proxy: str) -> str:
+    return proxy.split("@")[-1]
+
+
+class ProxyPool:
+    """
+    Spare proxies handed out to accounts whose own proxy keeps failing.
+
+    Failures are counted per proxy (and persisted with the rotations), the spare
+    with the fewest failures is handed out first, so bad proxies sink to the end.
+    Among equally failed spares the one with the fewest accounts currently on it
+    wins, so rotated accounts are spread instead of piling onto one spare.
+    """
+
+    def __init__(self, proxies: list[str], stats: ProxyStats):
+        self.proxies = proxies
+        self.stats = stats
+        self._failures: dict[str, int] | None = None
+        self._assigned: dict[str, int] = {}
+
+    @property
+    def failures(self) -> dict[str, int]:
+        if self._failures is None:
+            self._failures = self.stats.failures() if self.proxies else {}
+
+        return self._failures
+
+    def record_failure(self, proxy: str) -> None:
+        self.failures[proxy] = self.failures.get(proxy, 0) + 1
+        self.stats.record_failure(proxy)
+
+    def acquire(self, exclude: set[str]) -> str | None:
+        candidates = [proxy for proxy in self.proxies if proxy not in exclude]
+        if not candidates:
+            return None
+
+        proxy = min(candidates, key=lambda proxy: (self.failures.get(proxy, 0), self._assigned.get(proxy, 0)))
+        self.claim(proxy)
+        return proxy
+
+    def claim(self, proxy: str) -> None:
+        self._assigned[proxy] = self._assigned.get(proxy, 0) + 1
+
+    def release(self, proxy: str) -> None:
+        if self._assigned.get(proxy, 0) > 0:
+            self._assigned[proxy] -= 1
+
+    def rotate(self, proxy: str) -> str | None:
+        replacement = self.acquire(exclude={proxy})
+        if replacement:
+            self.stats.record_rotation(proxy)
+            logger.info(f"Proxy {mask_proxy(proxy)} rotated to spare proxy {mask_proxy(replacement)}")
+
+        return replacement
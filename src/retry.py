@@ -0,0 +1,107 @@
+import asyncio
+import random
+
+from typing import Awaitable, Callable, TypeVar
+
+from curl_cffi import CurlError
+from curl_cffi.requests.errors import SessionClosed
+
+from twitter_api.errors import TwitterError, TwitterAccountSuspended
+from .exceptions.base import MemeError
+from .breaker import get_status_code
+
+
+T = TypeVar("T")
+
+
+class RetryBudget:
+    """
+    Limits how many retries may be spent.
+
+    Every request deposits `ratio` tokens (up to `reserve`) and every retry withdraws
+    one, so retries can never exceed a fixed share of the real traffic. A budget with
+    `ratio=0` is a plain counter of `reserve` retries.
+    """
+
+    def __init__(self, reserve: float, ratio: float = 0.0):
+        self.reserve = reserve
+        self.ratio = ratio
+        self._tokens = reserve
+
+    def deposit(self) -> None:
+        self._tokens = min(self.reserve, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self._tokens < 1:
+            return False
+
+        self._tokens -= 1
+        return True
+
+
+class RetryPolicy:
+    RETRYABLE_MEME_ERRORS = {"not_found"}
+    RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+    NON_RETRYABLE_TWITTER_CODES = {32, 89, 220}
+
+    def __init__(
+        self,
+        max_attempts: int,
+        base_delay: float,
+        max_delay: float,
+        global_budget: RetryBudget,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.global_budget = global_budget
+
+    def is_retryable(self, error: Exception) -> bool:
+        if isinstance(error, MemeError):
+            return error.error_message() in self.RETRYABLE_MEME_ERRORS
+
+        status_code = get_status_code(error)
+        if status_code is not None:
+            return status_code in self.RETRYABLE_STATUS_CODES
+
+        if isinstance(error, SessionClosed):
+            return False
+
+        if isinstance(error, TwitterAccountSuspended):
+            return False
+
+        if isinstance(error, TwitterError):
+            return error.error_code not in self.NON_RETRYABLE_TWITTER_CODES
+
+        return isinstance(error, (CurlError, ConnectionError, TimeoutError, asyncio.TimeoutError))
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    async def run(
+        self,
+        operation: Callable[[], Awaitable[T]],
+        budget: RetryBudget,
+        sleep: Callable[[float], Awaitable[None]],
+        on_retry: Callable[[Exception, float], None] | None = None,
+    ) -> T:
+        attempt = 0
+        while True:
+            self.global_budget.deposit()
+            try:
+                return await operation()
+
+            except Exception as error:
+                attempt += 1
+                if (
+                    attempt >= self.max_attempts
+                    or not self.is_retryable(error)
+                    or not budget.withdraw()
+                    or not self.global_budget.withdraw()
+                ):
+                    raise
+
+                delay = self.backoff(attempt)
+                if on_retry:
+                    on_retry(error, delay)
+                await sleep(delay)
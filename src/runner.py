@@ -0,0 +1,60 @@
+import asyncio
+import time
+
+from typing import Callable
+from loguru import logger
+
+from loader import config, scheduler, sessions
+from models import Account, ExportAccountData
+from .bot import MemeQuests
+
+
+async def run_safe(account: Account) -> ExportAccountData | None:
+    async with scheduler.slot():
+        meme_quests = MemeQuests(account)
+        return await meme_quests.start()
+
+
+async def worker(queue: asyncio.Queue, submit: Callable[[ExportAccountData], None]):
+    while True:
+        account = await queue.get()
+        try:
+            if account is None:
+                return
+
+            export_account_data = await run_safe(account)
+            if export_account_data:
+                submit(export_account_data)
+        finally:
+            queue.task_done()
+
+
+async def produce_accounts(queue: asyncio.Queue, accounts: list[Account], workers_count: int):
+    for account in accounts:
+        await queue.put(account)
+
+    for _ in range(workers_count):
+        await queue.put(None)
+
+
+async def process_accounts(accounts: list[Account], submit: Callable[[ExportAccountData], None]):
+    workers_count = min(config.active_accounts, len(accounts))
+    if not workers_count:
+        return
+
+    queue = asyncio.Queue(maxsize=workers_count)
+    workers = [asyncio.create_task(worker(queue, submit)) for _ in range(workers_count)]
+    try:
+        await asyncio.gather(produce_accounts(queue, accounts, workers_count), *workers)
+    finally:
+        logger.info(f"Session pool | {sessions.stats()}")
+        await sessions.close()
+
+
+async def report_throughput(get_processed: Callable[[], int], total: int, started_at: float, interval: int = 60):
+    while True:
+        await asyncio.sleep(interval)
+        elapsed = time.monotonic() - started_at
+        logger.info(
+            f"Progress: {get_processed()}/{total} accounts | Throughput: {get_processed() / elapsed * 60:.2f} accounts/min"
+        )
@@ -0,0 +1,196 @@
+import asyncio
+import heapq
+import itertools
+
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from loguru import logger
+
+
+_holds_slot: ContextVar[bool] = ContextVar("holds_slot", default=False)
+
+
+class SlotScheduler:
+    """
+    Limits how many accounts do network work at the same time.
+
+    Accounts give their slot back while they sleep between requests and queue
+    for it again by wake-up time, so the earliest due account is served first
+    and new accounts only get a slot when nobody who already started is due.
+    """
+
+    NEW_ACCOUNT_PRIORITY = float("inf")
+
+    def __init__(self, slots: int):
+        self._slots = slots
+        self._in_use = 0
+        self._waiters: list[tuple[float, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    @property
+    def slots(self) -> int:
+        return self._slots
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    async def acquire(self, priority: float = NEW_ACCOUNT_PRIORITY) -> None:
+        if self._in_use < self._slots and not self._waiters:
+            self._in_use += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        self._wake_up()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def resize(self, slots: int) -> None:
+        self._slots = slots
+        self._wake_up()
+
+    def release(self) -> None:
+        self._in_use -= 1
+        self._wake_up()
+
+    def _wake_up(self) -> None:
+        while self._waiters and self._in_use < self._slots:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+
+            self._in_use += 1
+            future.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self, priority: float = NEW_ACCOUNT_PRIORITY):
+        await self.acquire(priority)
+        token = _holds_slot.set(True)
+        try:
+            yield
+        finally:
+            holding = _holds_slot.get()
+            _holds_slot.reset(token)
+            if holding:
+                self.release()
+
+    def sub_slot(self):
+        """Own slot for a sub-task of an account that already started, served by current time."""
+        return self.slot(priority=asyncio.get_running_loop().time())
+
+    @asynccontextmanager
+    async def released(self):
+        """Hands the caller's slot back while it only waits on sub-tasks that take their own slots."""
+        if not _holds_slot.get():
+            yield
+            return
+
+        self.release()
+        _holds_slot.set(False)
+        try:
+            yield
+        finally:
+            await self.acquire(priority=asyncio.get_running_loop().time())
+            _holds_slot.set(True)
+
+    async def sleep(self, delay: float) -> None:
+        if not _holds_slot.get():
+            await asyncio.sleep(delay)
+            return
+
+        loop = asyncio.get_running_loop()
+        due = loop.time() + delay
+        self.release()
+        _holds_slot.set(False)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            await self.acquire(priority=due)
+            _holds_slot.set(True)
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD controller for the number of scheduler slots.
+
+    Every `window` requests the observed error rate and median latency are compared
+    with the targets: a healthy window adds one slot, an unhealthy one multiplies
+    the slots by `decrease_factor`. The result is clamped to [min_slots, max_slots].
+
+    The baseline latency is a decaying minimum: a faster error-free window lowers it
+    at once, a slower one pulls it up by `baseline_decay` of the difference, so one
+    unusually fast window can't pin the controller at min_slots for the whole run.
+    """
+
+    def __init__(
+        self,
+        scheduler: SlotScheduler,
+        min_slots: int,
+        max_slots: int,
+        window: int = 20,
+        max_error_rate: float = 0.1,
+        latency_tolerance: float = 2.0,
+        decrease_factor: float = 0.7,
+        baseline_decay: float = 0.1,
+    ):
+        self.scheduler = scheduler
+        self.min_slots = min_slots
+        self.max_slots = max_slots
+        self.window = window
+        self.max_error_rate = max_error_rate
+        self.latency_tolerance = latency_tolerance
+        self.decrease_factor = decrease_factor
+        self.baseline_decay = baseline_decay
+
+        self._latencies: list[float] = []
+        self._errors = 0
+        self._baseline_latency: float | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.min_slots < self.max_slots
+
+    def observe(self, latency: float, success: bool) -> None:
+        if not self.enabled:
+            return
+
+        self._latencies.append(latency)
+        if not success:
+            self._errors += 1
+
+        if len(self._latencies) >= self.window:
+            self._adjust()
+
+    def _adjust(self) -> None:
+        error_rate = self._errors / len(self._latencies)
+        latency = sorted(self._latencies)[len(self._latencies) // 2]
+        self._latencies.clear()
+        self._errors = 0
+
+        baseline = self._baseline_latency
+        overloaded = error_rate > self.max_error_rate or (
+            baseline is not None and latency > baseline * self.latency_tolerance
+        )
+
+        if error_rate <= self.max_error_rate:
+            if baseline is None or latency < baseline:
+                self._baseline_latency = latency
+            else:
+                self._baseline_latency = baseline + (latency - baseline) * self.baseline_decay
+
+        slots = self.scheduler.slots
+        if overloaded:
+            slots = max(self.min_slots, int(slots * self.decrease_factor))
+        else:
+            slots = min(self.max_slots, slots + 1)
+
+        if slots != self.scheduler.slots:
+            logger.debug(
+                f"Concurrency {'decreased' if overloaded else 'increased'} to {slots} | Error rate: {error_rate:.0%} | Median latency: {latency:.2f} sec"
+            )
+            self.scheduler.resize(slots)
@@ -0,0 +1,87 @@
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+
+from curl_cffi.requests import AsyncSession
+
+
+class SessionPool:
+    """
+    Process-wide curl sessions keyed by (proxy, impersonation profile).
+
+    Every account and phase going through the same proxy shares one session and with
+    it the curl handles and open TLS connections. Sessions carry no account state:
+    authorization and user-agent headers are sent with each request, only cookies set
+    by the API (e.g. anti-bot cookies of the proxy's IP) are shared.
+
+    Sessions are leased per use. Once nobody uses a session it stays open for reuse,
+    but only the `max_idle` most recently used idle sessions are kept, older ones are
+    closed, so one proxy per account doesn't keep a session per account open.
+    """
+
+    def __init__(self, max_clients: int, timeout: float, max_idle: int):
+        self.max_clients = max_clients
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self._sessions: dict[tuple[str, str | None], AsyncSession] = {}
+        self._leases: dict[tuple[str, str | None], int] = {}
+        self._idle: OrderedDict[tuple[str, str | None], None] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @asynccontextmanager
+    async def lease(self, proxy: str | None, impersonate: str | None = None):
+        key = (proxy, impersonate)
+        session = self._get(key)
+        self._leases[key] = self._leases.get(key, 0) + 1
+        self._idle.pop(key, None)
+        try:
+            yield session
+        finally:
+            self._leases[key] -= 1
+            if not self._leases[key]:
+                del self._leases[key]
+                self._idle[key] = None
+                await self._evict()
+
+    def _get(self, key: tuple[str, str | None]) -> AsyncSession:
+        session = self._sessions.get(key)
+        if session is not None:
+            self.hits += 1
+            return session
+
+        self.misses += 1
+        proxy, impersonate = key
+        session = self._sessions[key] = AsyncSession(
+            proxies={"http": proxy, "https": proxy} if proxy else None,
+            impersonate=impersonate,
+            max_clients=self.max_clients,
+            timeout=self.timeout,
+            verify=False,
+        )
+        return session
+
+    async def _evict(self) -> None:
+        while len(self._idle) > self.max_idle:
+            key, _ = self._idle.popitem(last=False)
+            self.evictions += 1
+            # Removed before awaiting, a lease taken meanwhile gets a new session
+            await self._sessions.pop(key).close()
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> str:
+        return (
+            f"Open sessions: {len(self._sessions)} | Hits: {self.hits} | Misses: {self.misses} | "
+            f"Hit rate: {self.hit_rate:.1%} | Evicted: {self.evictions}"
+        )
+
+    async def close(self) -> None:
+        sessions, self._sessions = self._sessions, {}
+        self._leases.clear()
+        self._idle.clear()
+        for session in sessions.values():
+            await session.close()
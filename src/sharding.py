@@ -0,0 +1,102 @@
+import asyncio
+import multiprocessing
+import queue
+import sys
+
+from loguru import logger
+
+from loader import config, api_rate_limiter, proxy_pool
+from models import Account, ExportAccountData
+from src.utils import AccountsExporter
+from .runner import process_accounts
+
+
+def shard_main(shard_index: int, shards_count: int, accounts: list[Account], resume: bool, messages: multiprocessing.Queue):
+    config.resume = resume
+    api_rate_limiter.scale(1 / shards_count)
+    for account in accounts:
+        if account.spare_proxy:
+            proxy_pool.claim(account.proxy)
+
+    logger.remove()
+    logger.add(
+        lambda message: messages.put(
+            ("log", message.record["level"].name, message.record["line"], f"P{shard_index} | {message.record['message']}")
+        ),
+        level="DEBUG",
+    )
+
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+    logger.info(f"Process started | Accounts: {len(accounts)}")
+
+    try:
+        asyncio.run(
+            process_accounts(
+                accounts, lambda data: messages.put(("result", data.model_dump()))
+            )
+        )
+    finally:
+        messages.put(("done", shard_index))
+
+
+def split_by_proxy(accounts: list[Account], shards_count: int) -> list[list[Account]]:
+    """
+    Split accounts into shards keeping all accounts of one proxy in the same shard.
+
+    Per-proxy limits, breakers and rotation counters live in process memory, so a
+    proxy split across processes would get each of them once per process. Proxy
+    groups are handed out largest first to the smallest shard to keep shards even.
+    """
+    groups: dict[str, list[Account]] = {}
+    for account in accounts:
+        groups.setdefault(account.proxy, []).append(account)
+
+    shards: list[list[Account]] = [[] for _ in range(shards_count)]
+    for group in sorted(groups.values(), key=len, reverse=True):
+        min(shards, key=len).extend(group)
+
+    return shards
+
+
+async def run_shards(exporter: AccountsExporter, accounts: list[Account], processes_count: int):
+    context = multiprocessing.get_context("spawn")
+    messages = context.Queue()
+    shards = split_by_proxy(accounts, processes_count)
+    processes = [
+        context.Process(
+            target=shard_main,
+            args=(shard_index, processes_count, shards[shard_index], config.resume, messages),
+            daemon=True,
+        )
+        for shard_index in range(processes_count)
+    ]
+    for process in processes:
+        process.start()
+
+    running = set(range(processes_count))
+    try:
+        while running:
+            try:
+                message = await asyncio.to_thread(messages.get, timeout=1)
+            except queue.Empty:
+                for shard_index in list(running):
+                    if not processes[shard_index].is_alive():
+                        logger.error(f"Process P{shard_index} exited unexpectedly | Exit code: {processes[shard_index].exitcode}")
+                        running.discard(shard_index)
+                continue
+
+            if message[0] == "log":
+                _, level, line, text = message
+                logger.patch(lambda record: record.update(line=line)).log(level, text)
+            elif message[0] == "result":
+                exporter.submit(ExportAccountData(**message[1]))
+            elif message[0] == "done":
+                running.discard(message[1])
+
+    finally:
+        for process in processes:
+            await asyncio.to_thread(process.join, 5)
+            if process.is_alive():
+                process.terminate()
@@ -0,0 +1,204 @@
+import base64
+import hashlib
+import os
+import sqlite3
+import time
+import orjson
+
+
+class StateStorage:
+    """Base class for the local SQLite state shared between runs."""
+
+    SCHEMA: str = ""
+
+    def __init__(self, path: str = "./config/state.db"):
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+        self._pid: int | None = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(self.SCHEMA)
+            self._pid = os.getpid()
+
+        return self._connection
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+class ProgressJournal(StateStorage):
+    """Append-only record of the phases and quests every wallet already finished."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS progress (
+            address TEXT NOT NULL,
+            phase TEXT NOT NULL,
+            quest_id INTEGER NOT NULL DEFAULT -1,
+            completed_at REAL NOT NULL,
+            PRIMARY KEY (address, phase, quest_id)
+        );
+    """
+
+    def record(self, address: str, phase: str, quest_id: int = -1) -> None:
+        self.connection.execute(
+            "INSERT OR IGNORE INTO progress (address, phase, quest_id, completed_at) VALUES (?, ?, ?, ?)",
+            (address, phase, quest_id, time.time()),
+        )
+
+    def completed_phases(self, address: str) -> set[str]:
+        rows = self.connection.execute(
+            "SELECT DISTINCT phase FROM progress WHERE address = ? AND phase != 'quest'", (address,)
+        )
+        return {row[0] for row in rows}
+
+    def completed_quests(self, address: str) -> set[int]:
+        rows = self.connection.execute(
+            "SELECT quest_id FROM progress WHERE address = ? AND phase = 'quest'", (address,)
+        )
+        return {row[0] for row in rows}
+
+    def is_finished(self, address: str) -> bool:
+        return "finished" in self.completed_phases(address)
+
+
+class ProxyStats(StateStorage):
+    """Failure and rotation counters of every proxy, kept across runs."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS proxy_stats (
+            proxy TEXT PRIMARY KEY,
+            failures INTEGER NOT NULL DEFAULT 0,
+            rotations INTEGER NOT NULL DEFAULT 0,
+            updated_at REAL NOT NULL
+        );
+    """
+
+    def failures(self) -> dict[str, int]:
+        rows = self.connection.execute("SELECT proxy, failures FROM proxy_stats")
+        return {row[0]: row[1] for row in rows}
+
+    def record_failure(self, proxy: str) -> None:
+        self.connection.execute(
+            "INSERT INTO proxy_stats (proxy, failures, updated_at) VALUES (?, 1, ?) "
+            "ON CONFLICT(proxy) DO UPDATE SET failures = failures + 1, updated_at = excluded.updated_at",
+            (proxy, time.time()),
+        )
+
+    def record_rotation(self, proxy: str) -> None:
+        self.connection.execute(
+            "INSERT INTO proxy_stats (proxy, rotations, updated_at) VALUES (?, 1, ?) "
+            "ON CONFLICT(proxy) DO UPDATE SET rotations = rotations + 1, updated_at = excluded.updated_at",
+            (proxy, time.time()),
+        )
+
+
+class TokenStore(StateStorage):
+    """Stakeland access tokens per wallet address, reused until they expire or get rejected."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tokens (
+            address TEXT PRIMARY KEY,
+            token TEXT NOT NULL,
+            expires_at REAL
+        );
+    """
+
+    # Tokens that expire sooner than this are not worth starting an account with
+    EXPIRY_MARGIN = 300
+
+    def get(self, address: str) -> str | None:
+        row = self.connection.execute(
+            "SELECT token, expires_at FROM tokens WHERE address = ?", (address,)
+        ).fetchone()
+        if not row:
+            return None
+
+        token, expires_at = row
+        if expires_at is not None and expires_at - self.EXPIRY_MARGIN <= time.time():
+            self.delete(address)
+            return None
+
+        return token
+
+    def save(self, address: str, token: str) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO tokens (address, token, expires_at) VALUES (?, ?, ?)",
+            (address, token, get_token_expiry(token)),
+        )
+
+    def delete(self, address: str) -> None:
+        self.connection.execute("DELETE FROM tokens WHERE address = ?", (address,))
+
+
+def get_token_expiry(token: str) -> float | None:
+    """Reads the `exp` claim of a JWT without verifying it."""
+    try:
+        payload = token.split(".")[1]
+        claims = orjson.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class TwitterBinds(StateStorage):
+    """Which Twitter account (by auth_token hash) every wallet address is bound to."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS twitter_binds (
+            address TEXT PRIMARY KEY,
+            auth_token_hash TEXT NOT NULL,
+            bound_at REAL NOT NULL
+        );
+        -- Twitter session cookies saved by earlier versions, no longer used
+        DROP TABLE IF EXISTS twitter_cookies;
+    """
+
+    @staticmethod
+    def _hash(auth_token: str) -> str:
+        return hashlib.sha256(auth_token.encode()).hexdigest()
+
+    def is_bound(self, address: str, auth_token: str) -> bool:
+        row = self.connection.execute(
+            "SELECT auth_token_hash FROM twitter_binds WHERE address = ?", (address,)
+        ).fetchone()
+        return bool(row) and row[0] == self._hash(auth_token)
+
+    def record(self, address: str, auth_token: str) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO twitter_binds (address, auth_token_hash, bound_at) VALUES (?, ?, ?)",
+            (address, self._hash(auth_token), time.time()),
+        )
+
+
+class WalletAddresses(StateStorage):
+    """Wallet address of every private key / mnemonic, so it is derived only once."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS wallet_addresses (
+            key_hash TEXT PRIMARY KEY,
+            address TEXT NOT NULL
+        );
+    """
+
+    @staticmethod
+    def _hash(pk_or_mnemonic: str) -> str:
+        return hashlib.sha256(pk_or_mnemonic.encode()).hexdigest()
+
+    def get(self, pk_or_mnemonic: str) -> str | None:
+        row = self.connection.execute(
+            "SELECT address FROM wallet_addresses WHERE key_hash = ?", (self._hash(pk_or_mnemonic),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def save(self, pk_or_mnemonic: str, address: str) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO wallet_addresses (key_hash, address) VALUES (?, ?)",
+            (self._hash(pk_or_mnemonic), address),
+        )
@@ -1 +1,2 @@
 from .main import *
+from .export import *
@@ -0,0 +1,153 @@
+import asyncio
+import os
+
+from loguru import logger
+
+from models import ExportAccountData
+
+
+def format_account_data(account: ExportAccountData) -> str:
+    if not account.ordinal_mnemonic:
+        return f"{account.auth_token}|{account.pk_or_mnemonic}|{account.proxy}"
+
+    return f"{account.auth_token}|{account.pk_or_mnemonic}|{account.proxy}|{account.ordinal_mnemonic}:{account.ordinal_address}"
+
+
+class AccountsExporter:
+    """
+    Streams account results to the results files as soon as each account finishes.
+
+    A single writer task drains the queue in batches, appends every batch with one
+    write call and fsyncs it. An unterminated last line (torn by a crash or added by
+    hand) is moved to "<file>.incomplete" on the next start, never deleted, so new
+    records always start on a line of their own.
+    """
+
+    def __init__(
+        self,
+        success_path: str = "./config/success_accounts.txt",
+        failed_path: str = "./config/failed_accounts.txt",
+        timeout_path: str = "./config/timeout_accounts.txt",
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+    ):
+        self.success_path = success_path
+        self.failed_path = failed_path
+        self.timeout_path = timeout_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.success_count = 0
+        self.failed_count = 0
+        self.timed_out_count = 0
+
+        self._queue: asyncio.Queue[ExportAccountData | None] = asyncio.Queue()
+        self._files: dict[str, int] = {}
+        self._writer: asyncio.Task | None = None
+
+    @property
+    def exported_count(self) -> int:
+        return self.success_count + self.failed_count + self.timed_out_count
+
+    async def start(self) -> None:
+        for path in (self.success_path, self.failed_path, self.timeout_path):
+            self._files[path] = await asyncio.to_thread(self._open, path)
+
+        self._writer = asyncio.create_task(self._write_loop())
+
+    def submit(self, account: ExportAccountData) -> None:
+        self._queue.put_nowait(account)
+
+    async def close(self) -> None:
+        if self._writer:
+            self._queue.put_nowait(None)
+            await asyncio.shield(self._writer)
+            self._writer = None
+
+        for fd in self._files.values():
+            os.close(fd)
+        self._files.clear()
+
+        logger.debug("Accounts results exported")
+
+    @staticmethod
+    def _open(path: str) -> int:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+
+        size = os.lseek(fd, 0, os.SEEK_END)
+        if size:
+            tail_size = min(size, 64 * 1024)
+            os.lseek(fd, size - tail_size, os.SEEK_SET)
+            tail = os.read(fd, tail_size)
+            if not tail.endswith(b"\n"):
+                last_newline = tail.rfind(b"\n")
+                if last_newline == -1 and tail_size < size:
+                    # No line start in sight, keep the data where it is and just terminate it
+                    os.write(fd, b"\n")
+                    os.fsync(fd)
+                    logger.warning(f"File <<{path}>> ended without a newline | Terminated the last line")
+                    return fd
+
+                incomplete_path = f"{path}.incomplete"
+                with open(incomplete_path, "ab") as file:
+                    file.write(tail[last_newline + 1:] + b"\n")
+                    file.flush()
+                    os.fsync(file.fileno())
+
+                os.ftruncate(fd, size - tail_size + last_newline + 1)
+                logger.warning(
+                    f"File <<{path}>> ended with an unterminated line | Moved it to <<{incomplete_path}>>"
+                )
+
+        return fd
+
+    async def _write_loop(self) -> None:
+        closed = False
+        loop = asyncio.get_running_loop()
+
+        while not closed:
+            account = await self._queue.get()
+            if account is None:
+                break
+
+            batch = [account]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    account = await asyncio.wait_for(self._queue.get(), max(deadline - loop.time(), 0))
+                except asyncio.TimeoutError:
+                    break
+
+                if account is None:
+                    closed = True
+                    break
+                batch.append(account)
+
+            await asyncio.to_thread(self._write_batch, batch)
+
+    def _write_batch(self, batch: list[ExportAccountData]) -> None:
+        lines: dict[str, list[str]] = {self.success_path: [], self.failed_path: [], self.timeout_path: []}
+        for account in batch:
+            if account.timed_out:
+                path = self.timeout_path
+            else:
+                path = self.success_path if account.success else self.failed_path
+            lines[path].append(format_account_data(account) + "\n")
+
+        for path, path_lines in lines.items():
+            if not path_lines:
+                continue
+
+            data = "".join(path_lines).encode()
+            fd = self._files[path]
+            written = os.write(fd, data)
+            while written < len(data):
+                written += os.write(fd, data[written:])
+            os.fsync(fd)
+
+            if path == self.success_path:
+                self.success_count += len(path_lines)
+            elif path == self.failed_path:
+                self.failed_count += len(path_lines)
+            else:
+                self.timed_out_count += len(path_lines)
@@ -1,11 +1,10 @@
 from embit import bip32, script
 from embit.networks import NETWORKS
+from eth_account import Account
 from eth_account.messages import encode_defunct
 from mnemonic import Mnemonic
-from web3 import Web3, Account
 
 from models import SignatureData, P2TRBTCWallet
-from loader import config
 
 
 Account.enable_unaudited_hdwallet_features()
@@ -13,8 +12,15 @@ Account.enable_unaudited_hdwallet_features()
 
 class Wallet:
     def __init__(self, pk_or_mnemonic: str):
-        self.web3 = Web3(Web3.HTTPProvider(config.eth_rpc))
-        self.wallet = self.web3.eth.account.from_mnemonic(pk_or_mnemonic) if len(pk_or_mnemonic.split()) in (12, 24) else self.web3.eth.account.from_key(pk_or_mnemonic)
+        self.wallet = self.load_account(pk_or_mnemonic)
+
+    @staticmethod
+    def load_account(pk_or_mnemonic: str):
+        return Account.from_mnemonic(pk_or_mnemonic) if len(pk_or_mnemonic.split()) in (12, 24) else Account.from_key(pk_or_mnemonic)
+
+    @staticmethod
+    def get_address(pk_or_mnemonic: str) -> str:
+        return Wallet.load_account(pk_or_mnemonic).address
 
     @property
     def address(self) -> str:
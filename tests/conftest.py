@@ -0,0 +1,21 @@
+import os
+import secrets
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import config.load_config as load_config_module
+from models import Account
+
+
+def make_account(proxy: str = "127.0.0.1:8080:user:pass") -> Account:
+    return Account(auth_token=secrets.token_hex(20), pk_or_mnemonic="0x" + secrets.token_hex(32), proxy=proxy)
+
+
+# loader reads config/accounts.txt on import and keeps its state in ./config/state.db,
+# give it a valid account and a throwaway working directory
+load_config_module.get_accounts = lambda: iter([make_account()])
+os.chdir(tempfile.mkdtemp())
+os.makedirs("config")
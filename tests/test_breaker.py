@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+
+import src.bot
+from src.breaker import CircuitBreakers
+from src.bot import MemeQuests
+from src.exceptions.base import CircuitOpenError
+from src.scheduler import SlotScheduler
+from conftest import make_account
+
+
+HOST = "memestaking-api.stakeland.com"
+
+
+@pytest.fixture
+def breakers(monkeypatch) -> CircuitBreakers:
+    circuit_breakers = CircuitBreakers(proxy_threshold=1, host_threshold=1, recovery_time=0.2)
+    monkeypatch.setattr(src.bot, "breakers", circuit_breakers)
+    monkeypatch.setattr(src.bot, "scheduler", SlotScheduler(1))
+    monkeypatch.setattr(src.bot.proxy_pool, "proxies", [])
+    return circuit_breakers
+
+
+def test_open_host_breaker_parks_until_recovery(breakers):
+    bot = MemeQuests(make_account())
+    breakers.host(HOST).record_failure()
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        async with src.bot.scheduler.slot():
+            await bot.check_breakers(HOST)
+        return loop.time() - started_at
+
+    assert asyncio.run(main()) >= 0.19
+    assert src.bot.scheduler.in_use == 0
+
+
+def test_open_proxy_breaker_without_spare_fails_fast(breakers):
+    bot = MemeQuests(make_account())
+    breakers.proxy(bot.account.proxy).record_failure()
+
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(bot.check_breakers(HOST))
@@ -0,0 +1,117 @@
+import asyncio
+
+from types import SimpleNamespace
+
+import pytest
+
+import loader
+import src.bot
+from curl_cffi.requests.errors import RequestsError
+from models import QuestResult, QuestsInfo, QuestsList
+from src.bot import MemeQuests
+from src.scheduler import SlotScheduler
+from conftest import make_account
+
+
+QUESTS = QuestsList(
+    quests=[{"id": quest_id, "type": "follow", "name": f"Quest {quest_id}"} for quest_id in range(0, 8)]
+)
+
+
+class FakeApi:
+    """Stands in for the stakeland API at MemeQuests._send_request, everything above it is real."""
+
+    def __init__(self):
+        self.auth_calls: list[str] = []
+
+    async def __call__(self, bot: MemeQuests, request_type, method, json_data, params, url, verify, model):
+        if method == "/wallet/auth":
+            self.auth_calls.append(bot.address)
+            await src.bot.scheduler.sleep(0.05)
+            return {"accessToken": "fresh"}
+
+        if bot.headers.get("authorization") != "Bearer fresh":
+            raise RequestsError("Unauthorized", response=SimpleNamespace(status_code=401))
+
+        # Every request backs off once, giving its slot back like a retry would
+        await src.bot.scheduler.sleep(0.05)
+
+        if method == "/farming/quests":
+            return QUESTS
+        if method.startswith("/farming/info/"):
+            return QuestsInfo(rewards=[])
+        return QuestResult(earned=1, steaks={"total": 1})
+
+
+@pytest.fixture
+def api(monkeypatch) -> FakeApi:
+    fake_api = FakeApi()
+    monkeypatch.setattr(MemeQuests, "_send_request", lambda bot, *args: fake_api(bot, *args))
+    monkeypatch.setattr(loader.config, "resume", False)
+    monkeypatch.setattr(src.bot.quests_cache, "ttl", 0)
+    return fake_api
+
+
+@pytest.fixture
+def quests_setup(monkeypatch, api):
+    def setup(slots: int, spacing: float, concurrency: int) -> SlotScheduler:
+        scheduler = SlotScheduler(slots)
+        monkeypatch.setattr(src.bot, "scheduler", scheduler)
+        monkeypatch.setattr(loader.config, "quests_spacing", spacing)
+        monkeypatch.setattr(loader.config, "quests_concurrency", concurrency)
+        return scheduler
+
+    return setup
+
+
+def make_bot(token: str = "fresh", cached: bool = False) -> MemeQuests:
+    bot = MemeQuests(make_account())
+    bot.headers["authorization"] = f"Bearer {token}"
+    bot._cached_token = cached
+    return bot
+
+
+def run_accounts(scheduler: SlotScheduler, bots: list[MemeQuests]) -> list[bool]:
+    async def run_account(bot: MemeQuests) -> bool:
+        async with scheduler.slot():
+            return await bot.complete_quests()
+
+    async def main():
+        return await asyncio.wait_for(asyncio.gather(*(run_account(bot) for bot in bots)), timeout=10)
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize("slots, accounts_count", [(5, 10), (2, 2), (1, 3)])
+def test_parallel_quests_share_slots_without_deadlock(quests_setup, slots, accounts_count):
+    scheduler = quests_setup(slots=slots, spacing=0.2, concurrency=3)
+
+    assert run_accounts(scheduler, [make_bot() for _ in range(accounts_count)]) == [True] * accounts_count
+    assert scheduler.in_use == 0
+
+
+def test_quests_of_one_account_keep_spacing(quests_setup, monkeypatch):
+    scheduler = quests_setup(slots=5, spacing=0.1, concurrency=3)
+    started_at = []
+
+    original_process_quest = MemeQuests.process_quest
+
+    async def process_quest(self, quest):
+        started_at.append(asyncio.get_running_loop().time())
+        return await original_process_quest(self, quest)
+
+    monkeypatch.setattr(MemeQuests, "process_quest", process_quest)
+
+    assert run_accounts(scheduler, [make_bot()]) == [True]
+    gaps = [later - earlier for earlier, later in zip(started_at, started_at[1:])]
+    assert len(started_at) == len(QUESTS.quests)
+    assert min(gaps) >= 0.09
+
+
+def test_parallel_reauthentication_without_deadlock(quests_setup, api):
+    scheduler = quests_setup(slots=1, spacing=0, concurrency=3)
+    bots = [make_bot(token="stale", cached=True) for _ in range(2)]
+
+    assert run_accounts(scheduler, bots) == [True, True]
+    assert sorted(api.auth_calls) == sorted(bot.address for bot in bots)
+    assert scheduler.in_use == 0
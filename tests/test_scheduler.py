@@ -0,0 +1,34 @@
+from src.scheduler import AdaptiveConcurrency, SlotScheduler
+
+
+def observe_window(concurrency: AdaptiveConcurrency, latency: float, success: bool = True) -> None:
+    for _ in range(concurrency.window):
+        concurrency.observe(latency, success)
+
+
+def test_one_fast_window_does_not_pin_concurrency_at_minimum():
+    scheduler = SlotScheduler(10)
+    concurrency = AdaptiveConcurrency(scheduler, min_slots=2, max_slots=20)
+
+    observe_window(concurrency, 1.0)
+    # Quick error answers, e.g. cached 4xx
+    observe_window(concurrency, 0.05)
+    for _ in range(5):
+        observe_window(concurrency, 1.0)
+    assert scheduler.slots == 2
+
+    # Normal latency becomes the baseline again and concurrency grows back
+    for _ in range(40):
+        observe_window(concurrency, 1.0)
+    assert scheduler.slots == 20
+
+
+def test_errors_decrease_and_never_move_baseline():
+    scheduler = SlotScheduler(10)
+    concurrency = AdaptiveConcurrency(scheduler, min_slots=2, max_slots=20)
+
+    observe_window(concurrency, 1.0)
+    observe_window(concurrency, 5.0, success=False)
+
+    assert scheduler.slots == 7
+    assert concurrency._baseline_latency == 1.0
@@ -1,2 +1,3 @@
 from .account import Account
+from .async_account import AsyncAccount
 from .errors import *
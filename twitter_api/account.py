@@ -35,8 +35,10 @@ if platform.system() != "Windows":
 
 
 class Account:
+    session_class = requests.Session
+
     def __init__(self):
-        self._session: requests.Session = requests.Session()
+        self._session: requests.Session = self.session_class()
         self._proxy: str = ""
         self._reformatted_proxy: str = ""
 
@@ -45,33 +47,19 @@ class Account:
         self.v2_api = "https://twitter.com/i/api/2"
 
     @classmethod
-    def run(
-        cls,
-        auth_token: str = None,
-        cookies: dict[str] = None,
-        proxy: str = None,
-        setup_session: bool = True,
-    ) -> "Account":
+    def _create(cls, auth_token: str, cookies: dict[str], proxy: str) -> "Account":
         account = cls()
         account._proxy = proxy
         if proxy:
             if proxy.startswith("http://"):
-                account._session = requests.Session(
-                    proxies={"http://": account.proxy}, timeout=30, verify=False
-                )
                 account._reformatted_proxy = account.proxy
-
             else:
                 account._reformatted_proxy = account.get_reformatted_proxy
-                account._session = requests.Session(
-                    proxies=(
-                        {"http://": account._reformatted_proxy}
-                        if account._reformatted_proxy
-                        else None
-                    ),
-                    timeout=30,
-                    verify=False,
-                )
+
+            # Configure the session made in __init__ rather than replace (and leak) it
+            account.session.proxies = account._proxies
+            account.session.timeout = 30
+            account.session.verify = False
 
         if not (auth_token, cookies):
             raise TwitterError(
@@ -80,21 +68,69 @@ class Account:
                 }
             )
 
-        if setup_session:
-            if auth_token:
-                account.session.cookies.update({"auth_token": auth_token})
-                account.setup_session()
-            else:
-                account.session.cookies.update(cookies)
+        return account
+
+    def _setup_oauth_session(self, auth_token: str, cookies: dict[str]):
+        """
+        Just enough for the OAuth authorize flow (`bind_account_v1`): the auth_token cookie
+        and static headers, without the guest token, ct0 and verify_credentials requests
+        """
+        self.session.cookies.update(cookies or {"auth_token": auth_token})
+        self.session.headers = get_headers(self.session)
+
+    @property
+    def _proxies(self) -> dict | None:
+        if not self._reformatted_proxy:
+            return None
+
+        return {"http": self._reformatted_proxy, "https": self._reformatted_proxy}
+
+    def _new_session(self) -> requests.Session:
+        return self.session_class(proxies=self._proxies, timeout=30, verify=False)
+
+    def close(self):
+        self._session.close()
+
+    def __enter__(self) -> "Account":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @classmethod
+    def run(
+        cls,
+        auth_token: str = None,
+        cookies: dict[str] = None,
+        proxy: str = None,
+        setup_session: bool = True,
+        oauth_only: bool = False,
+    ) -> "Account":
+        account = cls._create(auth_token, cookies, proxy)
+
+        if oauth_only:
+            account._setup_oauth_session(auth_token, cookies)
+            return account
+
+        try:
+            if setup_session:
+                if auth_token:
+                    account.session.cookies.update({"auth_token": auth_token})
+                    account.setup_session()
+                else:
+                    account.session.cookies.update(cookies)
 
-        else:
-            if not account.session.cookies.get(
-                "auth_token"
-            ) and not account.session.cookies.get("ct0"):
-                account.session.cookies.update({"auth_token": auth_token})
-                account.setup_session()
             else:
-                account.session.cookies.update(cookies)
+                if not (cookies and cookies.get("auth_token") and cookies.get("ct0")):
+                    account.session.cookies.update({"auth_token": auth_token})
+                    account.setup_session()
+                else:
+                    account.session.cookies.update(cookies)
+                    account.session.headers = get_headers(account.session)
+
+        except BaseException:
+            account.close()
+            raise
 
         return account
 
@@ -106,12 +142,8 @@ class Account:
             "proxy": self.proxy,
         }
 
-    def gql(
-        self,
-        method: str,
-        operation: tuple,
-        variables: dict,
-        features: dict = Operation.default_features,
+    def _gql_request(
+        self, method: str, operation: tuple, variables: dict, features: dict
     ) -> dict:
         qid, op = operation
         params = {
@@ -124,7 +156,7 @@ class Account:
         else:
             data = {"params": {k: orjson.dumps(v).decode() for k, v in params.items()}}
 
-        r = self.session.request(
+        return dict(
             method=method,
             url=f"{self.gql_api}/{qid}/{op}",
             headers=get_headers(self.session),
@@ -132,13 +164,29 @@ class Account:
             **data,
         )
 
+    def gql(
+        self,
+        method: str,
+        operation: tuple,
+        variables: dict,
+        features: dict = Operation.default_features,
+    ) -> dict:
+        r = self.session.request(
+            **self._gql_request(method, operation, variables, features)
+        )
         return self._verify_response(r)
 
-    def v1(self, path: str, params: dict) -> dict:
+    def _form_headers(self) -> dict:
         headers = get_headers(self.session)
         headers["content-type"] = "application/x-www-form-urlencoded"
+        return headers
+
+    def v1(self, path: str, params: dict) -> dict:
         r = self.session.post(
-            f"{self.v1_api}/{path}", headers=headers, data=params, allow_redirects=True
+            f"{self.v1_api}/{path}",
+            headers=self._form_headers(),
+            data=params,
+            allow_redirects=True,
         )
         return self._verify_response(r)
 
@@ -158,7 +206,7 @@ class Account:
                 # difference = reset_ts - current_ts
                 # asyncio.sleep(difference)
 
-            data = r.json()
+            data = orjson.loads(r.content)
         except ValueError:
             raise TwitterError(
                 {
@@ -281,15 +329,9 @@ class Account:
         return data["guest_token"]
 
     def setup_session(self):
-        session = requests.Session(
-            # follow_redirects=True,
-            proxies={"http://": self._reformatted_proxy} if self.proxy else None,
-            timeout=30,
-            verify=False,
-        )
-
         generated_csrf_token = secrets.token_hex(16)
-        guest_token = self.request_guest_token(session, generated_csrf_token)
+        with self._new_session() as session:
+            guest_token = self.request_guest_token(session, generated_csrf_token)
 
         cookies = {"ct0": generated_csrf_token, "gt": guest_token}
         headers = {"x-guest-token": guest_token, "x-csrf-token": generated_csrf_token}
@@ -308,123 +350,149 @@ class Account:
             {"x-csrf-token": self.session.cookies.get("ct0", domain=".twitter.com")}
         )
 
-    def bind_account_v1(self, bind_params: BindAccountParamsV1) -> BindAccountDataV1:
+    @staticmethod
+    def _parse_oauth_token(text: str) -> str:
+        token = re.search(
+            r'<input id="oauth_token" name="oauth_token" type="hidden" value="([^"]+)"',
+            text,
+        )
+        if token:
+            return token.group(1)
 
-        def get_oauth_token() -> str:
-            _response = requests.get(str(bind_params.url), allow_redirects=True)
-            raise_for_status(_response)
+        token = text.split("oauth_token=")
+        if len(token) > 1:
+            return token[1]
 
-            token = re.search(
-                r'<input id="oauth_token" name="oauth_token" type="hidden" value="([^"]+)"',
-                _response.text,
-            )
-            if token:
-                return token.group(1)
+        raise TwitterError(
+            {
+                "error_message": "Failed to get oauth token. "
+                "Make sure you are using correct cookies or url."
+            }
+        )
 
-            token = _response.text.split("oauth_token=")
-            if len(token) > 1:
-                return token[1]
+    @staticmethod
+    def _check_oauth_session(response: Response) -> None:
+        """
+        Twitter answers the authenticate page of an auth_token it doesn't accept
+        (logged out, suspended, locked) with a login page instead of an error.
+        """
+        path = urlsplit(str(response.url)).path
+        if path.startswith("/account/access"):
+            raise TwitterAccountSuspended("Account is locked or suspended")
 
+        if path in ("/login", "/i/flow/login") or 'name="session[username_or_email]"' in response.text:
             raise TwitterError(
                 {
-                    "error_message": "Failed to get oauth token. "
-                    "Make sure you are using correct cookies or url."
+                    "error_code": 32,
+                    "error_message": "Auth token is not logged in.",
                 }
             )
 
-        def get_authenticity_token(_oauth_token: str) -> BindAccountDataV1 | str:
-            params = {
-                "oauth_token": _oauth_token,
-            }
-            _response = self.session.get(
-                "https://api.twitter.com/oauth/authenticate", params=params
-            )
-            raise_for_status(_response)
-
-            token = re.search(
-                r'<input name="authenticity_token" type="hidden" value="([^"]+)"',
-                _response.text,
-            )
-            if token:
-                return token.group(1)
+    @staticmethod
+    def _parse_authenticity_token(text: str) -> BindAccountDataV1 | str:
+        token = re.search(
+            r'<input name="authenticity_token" type="hidden" value="([^"]+)"',
+            text,
+        )
+        if token:
+            return token.group(1)
 
-            bond_url = re.search(
-                r'<a class="maintain-context" href="([^"]+)', _response.text
+        bond_url = re.search(r'<a class="maintain-context" href="([^"]+)', text)
+        if bond_url:
+            bond_url = bond_url.group(1).replace("&amp;", "&")
+            _oauth_token, _oauth_verifier = bond_url.split("oauth_token=")[1].split(
+                "&oauth_verifier="
             )
-            if bond_url:
-                bond_url = bond_url.group(1).replace("&amp;", "&")
-                _oauth_token, _oauth_verifier = bond_url.split("oauth_token=")[1].split(
-                    "&oauth_verifier="
-                )
-                return BindAccountDataV1(
-                    url=bond_url,
-                    oauth_token=_oauth_token,
-                    oauth_verifier=_oauth_verifier,
-                )
-
-            raise TwitterError(
-                {
-                    "error_message": "Failed to get authenticity token. "
-                    "Make sure you are using correct cookies or url."
-                }
+            return BindAccountDataV1(
+                url=bond_url,
+                oauth_token=_oauth_token,
+                oauth_verifier=_oauth_verifier,
             )
 
-        def get_confirm_url(_oauth_token: str, _authenticity_token: str) -> str:
-            data = {
-                "authenticity_token": _authenticity_token,
-                "redirect_after_login": f"https://api.twitter.com/oauth/authorize?oauth_token={_oauth_token}",
-                "oauth_token": _oauth_token,
+        raise TwitterError(
+            {
+                "error_message": "Failed to get authenticity token. "
+                "Make sure you are using correct cookies or url."
             }
+        )
 
-            response = self.session.post(
-                "https://api.twitter.com/oauth/authorize",
-                data=data,
-                allow_redirects=True,
-            )
-            raise_for_status(response)
+    @staticmethod
+    def _authorize_data(oauth_token: str, authenticity_token: str) -> dict:
+        return {
+            "authenticity_token": authenticity_token,
+            "redirect_after_login": f"https://api.twitter.com/oauth/authorize?oauth_token={oauth_token}",
+            "oauth_token": oauth_token,
+        }
 
-            _confirm_url = re.search(
-                r'<a class="maintain-context" href="([^"]+)', response.text
-            )
-            if _confirm_url:
-                return _confirm_url.group(1).replace("&amp;", "&")
+    @staticmethod
+    def _parse_confirm_url(text: str) -> str:
+        confirm_url = re.search(r'<a class="maintain-context" href="([^"]+)', text)
+        if confirm_url:
+            return confirm_url.group(1).replace("&amp;", "&")
+
+        raise TwitterError(
+            {
+                "error_message": "Failed to get confirm url. "
+                "Make sure you are using correct cookies or url."
+            }
+        )
 
+    @staticmethod
+    def _parse_bind_redirect(url: str) -> BindAccountDataV1:
+        if "status=error" in url:
             raise TwitterError(
                 {
-                    "error_message": "Failed to get confirm url. "
+                    "error_message": "Failed to bind account. "
                     "Make sure you are using correct cookies or url."
                 }
             )
 
-        def process_confirm_url(_url: str) -> BindAccountDataV1:
-            response = self.session.get(_url, allow_redirects=True)
-            raise_for_status(response)
-
-            if "status=error" in response.url:
-                raise TwitterError(
-                    {
-                        "error_message": "Failed to bind account. "
-                        "Make sure you are using correct cookies or url."
-                    }
-                )
+        oauth_token, oauth_verifier = url.split("oauth_token=")[1].split(
+            "&oauth_verifier="
+        )
+        return BindAccountDataV1(
+            url=url,
+            oauth_token=oauth_token,
+            oauth_verifier=oauth_verifier,
+        )
 
-            _oauth_token, _oauth_verifier = response.url.split("oauth_token=")[1].split(
-                "&oauth_verifier="
-            )
-            return BindAccountDataV1(
-                url=response.url,
-                oauth_token=_oauth_token,
-                oauth_verifier=_oauth_verifier,
-            )
+    def bind_account_v1(
+        self, bind_params: BindAccountParamsV1, session: requests.Session = None
+    ) -> BindAccountDataV1:
+        """
+        `session` is used for the request to the app's bind url, so Twitter cookies
+        don't leak there. By default a fresh session through the account's proxy.
+        """
+        if session is None:
+            with self._new_session() as session:
+                response = session.get(str(bind_params.url), allow_redirects=True)
+        else:
+            response = session.get(str(bind_params.url), allow_redirects=True)
+        raise_for_status(response)
+        oauth_token = self._parse_oauth_token(response.text)
 
-        oauth_token = get_oauth_token()
-        authenticity_token = get_authenticity_token(oauth_token)
+        response = self.session.get(
+            "https://api.twitter.com/oauth/authenticate",
+            params={"oauth_token": oauth_token},
+        )
+        raise_for_status(response)
+        self._check_oauth_session(response)
+        authenticity_token = self._parse_authenticity_token(response.text)
 
         if isinstance(authenticity_token, BindAccountDataV1):
             return authenticity_token
 
-        confirm_url = get_confirm_url(oauth_token, authenticity_token)
-        return process_confirm_url(confirm_url)
+        response = self.session.post(
+            "https://api.twitter.com/oauth/authorize",
+            data=self._authorize_data(oauth_token, authenticity_token),
+            allow_redirects=True,
+        )
+        raise_for_status(response)
+        confirm_url = self._parse_confirm_url(response.text)
+
+        response = self.session.get(confirm_url, allow_redirects=True)
+        raise_for_status(response)
+        return self._parse_bind_redirect(response.url)
 
     def bind_account_v2(self, bind_params: BindAccountParamsV2) -> BindAccountDataV2:
 
@@ -763,7 +831,7 @@ class Account:
         return self.gql("POST", Operation.DeleteRetweet, variables)
 
     @staticmethod
-    def __get_cursor_value(data: dict, target_cursor_type: str, target_entry_type: str):
+    def _get_cursor_value(data: dict, target_cursor_type: str, target_entry_type: str):
         if target_entry_type != "threaded_conversation_with_injections_v2":
             for instruction in (
                 data.get("data", {})
@@ -830,7 +898,7 @@ class Account:
                 except KeyError:
                     return {"users": users_data[:limit] if limit > 0 else users_data}
 
-            cursor_value = self.__get_cursor_value(
+            cursor_value = self._get_cursor_value(
                 data, "Bottom", "favoriters_timeline"
             )
             if not cursor_value or (0 < limit <= len(users_data)):
@@ -869,7 +937,7 @@ class Account:
                 except KeyError:
                     return {"users": tweets_data[:limit] if limit > 0 else tweets_data}
 
-            cursor_value = self.__get_cursor_value(
+            cursor_value = self._get_cursor_value(
                 data, "Bottom", "retweeters_timeline"
             )
 
@@ -1656,9 +1724,15 @@ class Account:
         """Get User ID"""
         return int(re.findall('"u=(\d+)"', self.session.cookies.get("twid"))[0])
 
+    def dump_cookies(self) -> dict:
+        """Cookies as a plain dict, suitable for `Account.run(cookies=..., setup_session=False)`"""
+        # Cookies set by Twitter for a domain win over the ones set without one
+        cookies = sorted(self.session.cookies.jar, key=lambda cookie: bool(cookie.domain))
+        return {cookie.name: cookie.value for cookie in cookies}
+
     def save_cookies(self, fname: str = None):
         """Save cookies to file"""
-        cookies = self.session.cookies
+        cookies = self.dump_cookies()
         Path(f'{fname or cookies.get("username")}.cookies').write_bytes(
-            orjson.dumps(dict(cookies))
+            orjson.dumps(cookies)
         )